@@ -12,6 +12,7 @@ Args:
     refresh_time: Time in seconds between image rotations
 """
 
+import logging
 import os
 import shutil
 import sys
@@ -80,4 +81,6 @@ def main() -> NoReturn:
 
 
 if __name__ == "__main__":
+    # Show the image converter's progress messages alongside this module's prints
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
@@ -105,6 +105,7 @@ def monitor_sd_card() -> None:
     """
     global process, sd_was_removed
     sd_inserted: bool = False  # Track current SD card insertion state
+    sleep = time.sleep  # Resolved once instead of on every poll
 
     while True:
         try:
@@ -137,7 +138,7 @@ def monitor_sd_card() -> None:
         except Exception as e:
             print(f"Error monitoring SD card: {e}")
 
-        time.sleep(2)  # Poll interval for SD card status changes
+        sleep(2)  # Poll interval for SD card status changes
 
 
 def cleanup_stale_mounts() -> None:
@@ -1,9 +1,10 @@
 """Pytest configuration and shared fixtures for sd_monitor tests."""
 
-from typing import Generator
-from unittest.mock import MagicMock, patch
-from pathlib import Path
+import shutil
 import sys
+from pathlib import Path
+from typing import Callable, Dict, Generator, Optional, Tuple
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -36,10 +37,52 @@ sys.modules['lib.waveshare_epd.epd7in3f'] = _mock_epd_module
 sys.modules['lib.waveshare_epd.epdconfig'] = _mock_epdconfig_module
 
 
+def pytest_addoption(parser) -> None:
+    """Add the --run-loop option for tests that drive the display loop."""
+    parser.addoption(
+        "--run-loop",
+        action="store_true",
+        default=False,
+        help="run tests marked 'loop' that exercise the display rotation loop",
+    )
+
+
+def pytest_configure(config) -> None:
+    """Register custom markers."""
+    config.addinivalue_line("markers", "loop: exercises the infinite display loop (needs --run-loop)")
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """Skip 'loop' tests unless --run-loop was given."""
+    if config.getoption("--run-loop"):
+        return
+    skip_loop = pytest.mark.skip(reason="display loop test, use --run-loop to run")
+    for item in items:
+        if "loop" in item.keywords:
+            item.add_marker(skip_loop)
+
+
+@pytest.fixture(scope="class")
+def _class_subprocess_popen() -> Generator:
+    """Patch subprocess.Popen once per test class; see mock_subprocess_popen."""
+    with patch("sd_monitor.subprocess.Popen") as mock_popen:
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None  # Process is running
+        mock_process.pid = 12345
+        mock_popen.return_value = mock_process
+        yield mock_popen, mock_process
+
+
 @pytest.fixture
-def mock_subprocess_popen() -> Generator:
+def mock_subprocess_popen(_class_subprocess_popen) -> Generator:
     """Mock subprocess.Popen for testing frame_manager subprocess calls.
 
+    The patch is applied once per test class and its call history is cleared
+    before each test, instead of starting and stopping a patcher per test.
+
+    Args:
+        _class_subprocess_popen: Class-scoped (mock_popen, mock_process) pair
+
     Returns:
         tuple: A tuple of (mock_popen, mock_process) where:
             - mock_popen: MagicMock of subprocess.Popen class
@@ -52,16 +95,35 @@ def mock_subprocess_popen() -> Generator:
             mock_popen, mock_process = mock_subprocess_popen
             # Now subprocess.Popen calls will be mocked
     """
-    with patch("sd_monitor.subprocess.Popen") as mock_popen:
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None  # Process is running
-        mock_process.pid = 12345
-        mock_popen.return_value = mock_process
-        yield mock_popen, mock_process
+    mock_popen, mock_process = _class_subprocess_popen
+    mock_popen.reset_mock(side_effect=True)
+    mock_process.reset_mock(side_effect=True)
+    yield mock_popen, mock_process
+
+
+@pytest.fixture(scope="session")
+def _cached_mocks() -> Callable[[str], MagicMock]:
+    """Hand out one MagicMock per patch target for the whole session.
+
+    Returns a function ``(target) -> MagicMock``. The mock for each target is
+    built once and has its calls, return value and side effect cleared every
+    time it is handed out; fixtures still patch it in per test with
+    ``patch(target, new=...)``, so only the binding is redone each time.
+    """
+    cache: Dict[str, MagicMock] = {}
+
+    def _get(target: str) -> MagicMock:
+        mock = cache.get(target)
+        if mock is None:
+            mock = cache[target] = MagicMock()
+        mock.reset_mock(return_value=True, side_effect=True)
+        return mock
+
+    return _get
 
 
 @pytest.fixture
-def mock_subprocess_run() -> Generator:
+def mock_subprocess_run(_cached_mocks) -> Generator:
     """Mock subprocess.run for testing sudo operations.
 
     Mocks all subprocess.run calls to avoid actual system command execution.
@@ -75,33 +137,44 @@ def mock_subprocess_run() -> Generator:
             # subprocess.run calls will be captured but not executed
             assert mock_subprocess_run.call_count > 0
     """
-    with patch("sd_monitor.subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(returncode=0)
+    with patch("sd_monitor.subprocess.run", new=_cached_mocks("sd_monitor.subprocess.run")) as mock_run:
+        mock_run.return_value.returncode = 0
         yield mock_run
 
 
+@pytest.fixture(scope="session")
+def _session_sd_dir(tmp_path_factory) -> Path:
+    """Create the simulated SD card directory once per test session."""
+    return tmp_path_factory.mktemp("test_sd")
+
+
 @pytest.fixture
-def temp_sd_path(tmp_path) -> str:
-    """Create a temporary directory to simulate SD card path.
+def temp_sd_path(_session_sd_dir) -> Generator:
+    """Provide a temporary directory to simulate SD card path.
 
     Provides a temporary filesystem location that mimics an SD card mount point,
-    allowing tests to work with real file operations in isolation.
+    allowing tests to work with real file operations in isolation. The directory
+    is created once per session and emptied after each test, instead of creating
+    a fresh temporary directory for every test.
 
     Args:
-        tmp_path: Built-in pytest fixture for temporary directories
+        _session_sd_dir: Session-scoped directory backing the SD card path
 
-    Returns:
-        str: Path to a temporary directory (e.g., '/tmp/pytest-123/test_sd')
+    Yields:
+        str: Path to an empty temporary directory (e.g., '/tmp/pytest-123/test_sd0')
 
     Example:
-        def test_read_refresh_time(temp_sd_path):
-            # temp_sd_path is '/tmp/pytest-xxx/test_sd'
-            refresh_file = Path(temp_sd_path) / "refresh_time.txt"
-            refresh_file.write_text("300")
+        def test_start_frame_manager(temp_sd_path):
+            # temp_sd_path is '/tmp/pytest-xxx/test_sd0'
+            sd_monitor.start_frame_manager(temp_sd_path)
     """
-    sd_dir = tmp_path / "test_sd"
-    sd_dir.mkdir()
-    return str(sd_dir)
+    yield str(_session_sd_dir)
+    # Cleanup after test so the next one starts from an empty directory
+    for entry in _session_sd_dir.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
 
 
 @pytest.fixture
@@ -130,7 +203,7 @@ def mock_sd_mount_base(tmp_path, monkeypatch) -> str:
 
 
 @pytest.fixture
-def mock_os_listdir() -> Generator:
+def mock_os_listdir(_cached_mocks) -> Generator:
     """Mock os.listdir for SD card detection tests.
 
     Allows control over directory listing results during tests, enabling
@@ -143,12 +216,12 @@ def mock_os_listdir() -> Generator:
         def test_sd_detection(mock_os_listdir):
             mock_os_listdir.return_value = ["usb_disk", "another_disk"]
     """
-    with patch("sd_monitor.os.listdir") as mock_listdir:
+    with patch("sd_monitor.os.listdir", new=_cached_mocks("sd_monitor.os.listdir")) as mock_listdir:
         yield mock_listdir
 
 
 @pytest.fixture
-def mock_os_path_isdir() -> Generator:
+def mock_os_path_isdir(_cached_mocks) -> Generator:
     """Mock os.path.isdir for directory verification tests.
 
     Controls path type checking to differentiate between files and directories
@@ -161,12 +234,12 @@ def mock_os_path_isdir() -> Generator:
         def test_directory_detection(mock_os_path_isdir):
             mock_os_path_isdir.side_effect = [False, True]  # First is file, second is dir
     """
-    with patch("sd_monitor.os.path.isdir") as mock_isdir:
+    with patch("sd_monitor.os.path.isdir", new=_cached_mocks("sd_monitor.os.path.isdir")) as mock_isdir:
         yield mock_isdir
 
 
 @pytest.fixture
-def mock_os_access() -> Generator:
+def mock_os_access(_cached_mocks) -> Generator:
     """Mock os.access for permission checking tests.
 
     Controls permission verification results to test handling of accessible
@@ -179,12 +252,12 @@ def mock_os_access() -> Generator:
         def test_permissions(mock_os_access):
             mock_os_access.return_value = False  # Simulate no read/execute access
     """
-    with patch("sd_monitor.os.access") as mock_access:
+    with patch("sd_monitor.os.access", new=_cached_mocks("sd_monitor.os.access")) as mock_access:
         yield mock_access
 
 
 @pytest.fixture
-def mock_os_path_exists() -> Generator:
+def mock_os_path_exists(_cached_mocks) -> Generator:
     """Mock os.path.exists for file existence checks.
 
     Controls file existence verification to test handling of missing or present
@@ -197,7 +270,7 @@ def mock_os_path_exists() -> Generator:
         def test_missing_config(mock_os_path_exists):
             mock_os_path_exists.return_value = False  # Simulate missing file
     """
-    with patch("sd_monitor.os.path.exists") as mock_exists:
+    with patch("sd_monitor.os.path.exists", new=_cached_mocks("sd_monitor.os.path.exists")) as mock_exists:
         yield mock_exists
 
 
@@ -217,7 +290,7 @@ def mock_signal_sigterm() -> Generator:
 
 
 @pytest.fixture
-def mock_time_sleep() -> Generator:
+def mock_time_sleep(_cached_mocks) -> Generator:
     """Mock time.sleep to speed up tests.
 
     Prevents test slowdown from intentional delays in the polling loop.
@@ -231,24 +304,22 @@ def mock_time_sleep() -> Generator:
             # Test runs instantly instead of sleeping for 2 seconds
             mock_time_sleep.assert_called_with(2)
     """
-    with patch("sd_monitor.time.sleep") as mock_sleep:
+    with patch("sd_monitor.time.sleep", new=_cached_mocks("sd_monitor.time.sleep")) as mock_sleep:
         yield mock_sleep
 
 
 @pytest.fixture
-def reset_global_state(monkeypatch) -> Generator:
+def reset_global_state(monkeypatch) -> None:
     """Reset global state variables between tests.
 
-    Ensures test isolation by resetting module-level globals before and after each test.
-    This prevents state leakage between tests that modify sd_monitor.process or
-    sd_monitor.sd_was_removed.
+    Ensures test isolation by resetting module-level globals before each test;
+    monkeypatch restores their previous values afterwards. Only the two globals
+    are touched, with no module reload. This prevents state leakage between
+    tests that modify sd_monitor.process or sd_monitor.sd_was_removed.
 
     Args:
         monkeypatch: Built-in pytest fixture for modifying module attributes
 
-    Yields:
-        None
-
     Example:
         def test_process_state(reset_global_state):
             # Both globals start as None/False
@@ -257,10 +328,6 @@ def reset_global_state(monkeypatch) -> Generator:
     """
     monkeypatch.setattr("sd_monitor.process", None)
     monkeypatch.setattr("sd_monitor.sd_was_removed", False)
-    yield
-    # Cleanup after test
-    monkeypatch.setattr("sd_monitor.process", None)
-    monkeypatch.setattr("sd_monitor.sd_was_removed", False)
 
 
 @pytest.fixture
@@ -301,7 +368,7 @@ def capture_subprocess_calls() -> Generator:
 
 
 @pytest.fixture
-def mock_get_refresh_time() -> Generator:
+def mock_get_refresh_time(_cached_mocks) -> Generator:
     """Mock get_refresh_time function for integration tests.
 
     Replaces the get_refresh_time function with a mock that returns 600 by default.
@@ -316,13 +383,13 @@ def mock_get_refresh_time() -> Generator:
             mock_get_refresh_time.return_value = 300
             # get_refresh_time() calls will return 300
     """
-    with patch("sd_monitor.get_refresh_time") as mock_get_time:
+    with patch("sd_monitor.get_refresh_time", new=_cached_mocks("sd_monitor.get_refresh_time")) as mock_get_time:
         mock_get_time.return_value = 600
         yield mock_get_time
 
 
 @pytest.fixture
-def mock_start_frame_manager() -> Generator:
+def mock_start_frame_manager(_cached_mocks) -> Generator:
     """Mock start_frame_manager function for integration tests.
 
     Replaces the start_frame_manager function to prevent actual subprocess creation.
@@ -337,12 +404,12 @@ def mock_start_frame_manager() -> Generator:
             # start_frame_manager() calls are captured but not executed
             assert mock_start_frame_manager.call_count > 0
     """
-    with patch("sd_monitor.start_frame_manager") as mock_start:
+    with patch("sd_monitor.start_frame_manager", new=_cached_mocks("sd_monitor.start_frame_manager")) as mock_start:
         yield mock_start
 
 
 @pytest.fixture
-def mock_monitor_sd_card() -> Generator:
+def mock_monitor_sd_card(_cached_mocks) -> Generator:
     """Mock monitor_sd_card function for integration tests.
 
     Replaces the monitor_sd_card function to prevent the infinite polling loop.
@@ -357,12 +424,12 @@ def mock_monitor_sd_card() -> Generator:
             # main() completes without hanging in infinite loop
             assert mock_monitor_sd_card.called
     """
-    with patch("sd_monitor.monitor_sd_card") as mock_monitor:
+    with patch("sd_monitor.monitor_sd_card", new=_cached_mocks("sd_monitor.monitor_sd_card")) as mock_monitor:
         yield mock_monitor
 
 
 @pytest.fixture
-def mock_cleanup_stale_mounts() -> Generator:
+def mock_cleanup_stale_mounts(_cached_mocks) -> Generator:
     """Mock cleanup_stale_mounts function for integration tests.
 
     Replaces the cleanup_stale_mounts function to prevent actual file system
@@ -378,7 +445,7 @@ def mock_cleanup_stale_mounts() -> Generator:
             # Verify cleanup was called
             assert mock_cleanup_stale_mounts.called
     """
-    with patch("sd_monitor.cleanup_stale_mounts") as mock_cleanup:
+    with patch("sd_monitor.cleanup_stale_mounts", new=_cached_mocks("sd_monitor.cleanup_stale_mounts")) as mock_cleanup:
         yield mock_cleanup
 
 
@@ -430,45 +497,39 @@ def username_sudo(monkeypatch) -> str:
     return "sudouser"
 
 
-@pytest.fixture
-def autouse_print_suppression(capsys) -> Generator:
-    """Suppress print output during tests for cleaner output.
-
-    Clears captured output after each test to keep test output clean.
-
-    Args:
-        capsys: Built-in pytest fixture for capturing print output
+# ===========================
+# Fixtures for display_manager, frame_manager, image_converter
+# ===========================
 
-    Yields:
-        None
+# Patch with the built-in monkeypatch fixture rather than pytest-mock's
+# `mocker`. pytest-mock is deliberately not a dependency: some of its releases
+# inspected the call stack on every patch, slowing mock-heavy suites several
+# times over. If it is ever added, pin it to a release without that overhead
+# (pytest-mock>=3.6) in requirements-dev.txt.
 
-    Note:
-        This fixture is rarely used directly. Tests typically use capsys parameter
-        to assert on print output when needed.
-    """
-    yield
-    capsys.readouterr()  # Clear captured output
+# EPD driver attributes used by display_manager; restricts the cached mock so
+# typos in tests fail instead of silently creating child mocks.
+_EPD_SPEC = ['width', 'height', 'init', 'display', 'getbuffer', 'Clear', 'sleep']
 
+# Built once at import time and reset per test; MagicMock construction is the
+# dominant setup cost in the display tests. copy.copy() is not used because a
+# shallow copy shares child mocks (and their call records) with the original.
+_CACHED_EPD = MagicMock(spec=_EPD_SPEC)
+_CACHED_EPD.width = 800
+_CACHED_EPD.height = 480
+_CACHED_EPD.init.return_value = 0
+_CACHED_EPD.getbuffer.return_value = bytes(800 * 480)
 
-# ===========================
-# Fixtures for display_manager, frame_manager, image_converter
-# ===========================
 
 @pytest.fixture
 def mock_epd() -> MagicMock:
     """Mock Waveshare EPD7.3F e-paper display driver.
 
-    Provides a fully functional mock for hardware interactions.
+    Returns the cached driver mock with call history and side effects cleared,
+    so each test starts from a clean instance without rebuilding it.
     """
-    epd = MagicMock()
-    epd.width = 800
-    epd.height = 480
-    epd.init = MagicMock(return_value=0)
-    epd.display = MagicMock()
-    epd.getbuffer = MagicMock(return_value=bytes(800 * 480))
-    epd.Clear = MagicMock()
-    epd.sleep = MagicMock()
-    return epd
+    _CACHED_EPD.reset_mock(side_effect=True)
+    return _CACHED_EPD
 
 
 @pytest.fixture
@@ -485,44 +546,39 @@ def mock_epd_module(mock_epd, monkeypatch) -> tuple:
     return mock_module, mock_epd
 
 
-@pytest.fixture
-def mock_pil_image() -> tuple:
-    """Mock PIL.Image with common operations."""
-    with patch('PIL.Image.open') as mock_open_img:
-        mock_img = MagicMock()
-        mock_img.size = (800, 480)
-        mock_img.mode = 'RGB'
-        mock_img.rotate = MagicMock(return_value=mock_img)
-        mock_img.resize = MagicMock(return_value=mock_img)
-        mock_img.crop = MagicMock(return_value=mock_img)
-        mock_img.save = MagicMock()
-        mock_open_img.return_value = mock_img
-        yield mock_open_img, mock_img
-
-
-@pytest.fixture
-def mock_image_ops() -> Generator:
-    """Mock PIL.ImageOps for EXIF handling."""
-    with patch('PIL.ImageOps.exif_transpose') as mock_transpose:
-        mock_transpose.side_effect = lambda img: img
-        yield mock_transpose
-
-
-@pytest.fixture
-def mock_image_enhance() -> tuple:
-    """Mock PIL.ImageEnhance for color/contrast operations."""
-    with patch('PIL.ImageEnhance.Color') as mock_color, \
-         patch('PIL.ImageEnhance.Contrast') as mock_contrast:
-
-        mock_color_obj = MagicMock()
-        mock_color_obj.enhance = MagicMock(side_effect=lambda factor: MagicMock())
-        mock_color.return_value = mock_color_obj
+@pytest.fixture(scope="session")
+def fake_image_factory() -> Callable[..., MagicMock]:
+    """Build PIL image stand-ins without allocating pixel buffers.
 
-        mock_contrast_obj = MagicMock()
-        mock_contrast_obj.enhance = MagicMock(side_effect=lambda factor: MagicMock())
-        mock_contrast.return_value = mock_contrast_obj
-
-        yield mock_color, mock_contrast, mock_color_obj, mock_contrast_obj
+    Returns a factory ``(width, height, orientation=None, image_format=None) -> MagicMock``.
+    Each distinct key is built once per session as a ``MagicMock(spec=Image.Image)``
+    in RGB mode whose resize() and convert() return the stand-in itself and whose
+    getexif() reports ``orientation`` when given; call records are cleared every
+    time it is handed out.
+    """
+    from PIL import ExifTags, Image
+
+    cache: Dict[Tuple[int, int, Optional[int], Optional[str]], MagicMock] = {}
+
+    def _make(
+        width: int, height: int, orientation: Optional[int] = None, image_format: Optional[str] = None
+    ) -> MagicMock:
+        key = (width, height, orientation, image_format)
+        img = cache.get(key)
+        if img is None:
+            img = MagicMock(spec=Image.Image)
+            img.size = (width, height)
+            img.mode = 'RGB'
+            img.format = image_format
+            img.__enter__.return_value = img
+            img.getexif.return_value = {} if orientation is None else {ExifTags.Base.Orientation: orientation}
+            img.resize.return_value = img
+            img.convert.return_value = img
+            cache[key] = img
+        img.reset_mock()
+        return img
+
+    return _make
 
 
 @pytest.fixture
@@ -12,225 +12,181 @@ Tests cover:
 - Edge cases (empty directory, single image, missing files)
 
 Test organization: Class-based with method names describing scenarios.
-Mocking strategy: All hardware and PIL operations mocked.
+Mocking strategy: All hardware and PIL operations mocked once per test by the
+autouse ``patched_env`` fixture (monkeypatch instead of stacked ``@patch``).
 """
 
-from unittest.mock import MagicMock, patch, call
+from types import SimpleNamespace
+from typing import Callable
+from unittest.mock import MagicMock, patch
 import pytest
-import random
 
+from display_manager import DisplayManager
 
-class TestDisplayManagerInit:
-    """Tests for DisplayManager initialization."""
-
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_init_with_valid_parameters(self, mock_epd_class, mock_atexit):
-        """Test successful initialization with valid parameters."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
 
-        manager = DisplayManager('/test/images', 60)
+class FakeImage:
+    """Lightweight stand-in for the PIL image returned by Image.open().
 
-        assert manager.image_folder == '/test/images'
-        assert manager.refresh_time == 60
-        assert manager.rotation == 0
+    Supports only what display_manager touches (context manager, size and
+    rotate) and records requested rotation angles, avoiding MagicMock's
+    per-attribute child-mock creation.
+    """
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_init_registers_atexit_cleanup(self, mock_epd_class, mock_atexit):
-        """Test that atexit.register is called for cleanup."""
-        from display_manager import DisplayManager
+    __slots__ = ('size', 'rotations')
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
+    def __init__(self, size=(800, 480)):
+        self.size = size
+        self.rotations = []
 
-        DisplayManager('/test/images', 60)
+    def __enter__(self):
+        return self
 
-        mock_atexit.assert_called_once()
+    def __exit__(self, *exc_info):
+        return False
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_init_initializes_epd_hardware(self, mock_epd_class, mock_atexit):
-        """Test that EPD hardware is initialized."""
-        from display_manager import DisplayManager
+    def rotate(self, angle, **kwargs):
+        self.rotations.append(angle)
+        return self
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
 
-        DisplayManager('/test/images', 60)
+@pytest.fixture(autouse=True)
+def patched_env(monkeypatch, mock_epd) -> SimpleNamespace:
+    """Patch hardware, filesystem, sleep and PIL access for every test.
 
-        # Verify EPD class was instantiated
-        mock_epd_class.assert_called_once()
+    Tests customize behavior through the returned namespace, e.g.
+    ``patched_env.listdir.return_value = ['image.jpg']``.
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_init_default_rotation_zero(self, mock_epd_class, mock_atexit):
-        """Test that default rotation is 0 degrees."""
-        from display_manager import DisplayManager
+    Returns:
+        SimpleNamespace: epd_class, epd, atexit, listdir, sleep and pil_open mocks
+    """
+    env = SimpleNamespace(
+        epd_class=MagicMock(return_value=mock_epd),
+        epd=mock_epd,
+        atexit=MagicMock(),
+        listdir=MagicMock(return_value=[]),
+        sleep=MagicMock(),
+        pil_open=MagicMock(),
+    )
+    monkeypatch.setattr('display_manager.epd7in3f.EPD', env.epd_class)
+    monkeypatch.setattr('atexit.register', env.atexit)
+    monkeypatch.setattr('os.listdir', env.listdir)
+    monkeypatch.setattr('time.sleep', env.sleep)
+    monkeypatch.setattr('PIL.Image.open', env.pil_open)
+    return env
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
 
-        manager = DisplayManager('/test/images', 60)
+@pytest.fixture
+def manager_factory(patched_env) -> Callable[..., DisplayManager]:
+    """Factory building DisplayManager instances against the patched environment."""
+    def _make(image_folder: str = '/test/images', refresh_time: int = 60) -> DisplayManager:
+        return DisplayManager(image_folder, refresh_time)
 
-        assert manager.rotation == 0
+    return _make
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_init_with_custom_rotation(self, mock_epd_class, mock_atexit):
-        """Test initialization with custom rotation parameter."""
-        from display_manager import DisplayManager
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
+@pytest.fixture
+def manager(manager_factory) -> DisplayManager:
+    """DisplayManager built against the patched environment."""
+    return manager_factory()
 
-        # Note: Check actual implementation for rotation parameter support
-        manager = DisplayManager('/test/images', 60)
-        # Rotation may be set via config or attribute
-        assert hasattr(manager, 'rotation')
-
-
-class TestFetchImageFiles:
-    """Tests for image file discovery."""
 
-    @patch('os.listdir')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_fetch_image_files_returns_all_files(self, mock_epd_class, mock_atexit, mock_listdir):
-        """Test that fetch_image_files returns all files in directory."""
-        from display_manager import DisplayManager
+def _stop_after_displays(manager: DisplayManager, count: int = 1) -> None:
+    """Make display_images() exit once ``count`` images have reached the EPD.
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_listdir.return_value = ['img1.jpg', 'img2.png', 'img3.bmp']
+    Flips the real stop_display flag from the display call instead of raising
+    KeyboardInterrupt out of the mocked sleep.
+    """
+    def _stop(*args, **kwargs):
+        if manager.epd.display.call_count >= count:
+            manager.stop_display = True
 
-        manager = DisplayManager('/test/images', 60)
-        images = manager.fetch_image_files()
+    manager.epd.display.side_effect = _stop
 
-        assert len(images) == 3
-        assert 'img1.jpg' in images
-        assert 'img2.png' in images
-        assert 'img3.bmp' in images
 
-    @patch('os.listdir')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_fetch_image_files_empty_directory(self, mock_epd_class, mock_atexit, mock_listdir):
-        """Test handling of empty directory."""
-        from display_manager import DisplayManager
+def _one_iteration(manager: DisplayManager, patched_env, files, displays: int = 1) -> FakeImage:
+    """Run display_images() against ``files`` until ``displays`` images are shown.
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_listdir.return_value = []
+    Clears the mocks first so several scenarios can share one manager.
 
-        manager = DisplayManager('/test/images', 60)
-        images = manager.fetch_image_files()
+    Returns:
+        FakeImage: The image returned by every Image.open() call
+    """
+    img = FakeImage()
+    patched_env.listdir.return_value = files
+    patched_env.pil_open.reset_mock(side_effect=True)
+    patched_env.pil_open.return_value = img
+    manager.epd.reset_mock(side_effect=True)
+    _stop_after_displays(manager, displays)
+    manager.display_images()
+    return img
 
-        assert len(images) == 0
-        assert images == []
 
-    @patch('os.listdir')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_fetch_image_files_single_image(self, mock_epd_class, mock_atexit, mock_listdir):
-        """Test with single image file."""
-        from display_manager import DisplayManager
+class TestDisplayManagerInit:
+    """Tests for DisplayManager initialization."""
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_listdir.return_value = ['single.jpg']
+    def test_init(self, manager_factory, patched_env):
+        """Test configuration, default rotation, EPD setup and atexit registration."""
+        manager = manager_factory('/test/images', 60)
 
-        manager = DisplayManager('/test/images', 60)
-        images = manager.fetch_image_files()
+        assert (manager.image_folder, manager.refresh_time, manager.rotation) == ('/test/images', 60, 0)
+        patched_env.epd_class.assert_called_once()
+        manager.epd.init.assert_called_once()
+        patched_env.atexit.assert_called_once_with(manager.reset_frame)
 
-        assert len(images) == 1
-        assert images[0] == 'single.jpg'
 
-    @patch('os.listdir')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_fetch_image_files_no_filtering(self, mock_epd_class, mock_atexit, mock_listdir):
-        """Test that no filtering is applied (returns all items including non-images)."""
-        from display_manager import DisplayManager
+class TestFetchImageFiles:
+    """Tests for image file discovery."""
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_listdir.return_value = ['image.jpg', 'readme.txt', 'config.ini', 'photo.png']
+    @pytest.mark.parametrize("files,expected_len", [
+        (['img1.jpg', 'img2.png', 'img3.bmp'], 3),
+        ([], 0),
+        (['single.jpg'], 1),
+        # No filtering for image types: non-images are returned too
+        (['image.jpg', 'readme.txt', 'config.ini', 'photo.png'], 4),
+    ], ids=['three_files', 'empty', 'single', 'mixed'])
+    def test_fetch_image_files(self, manager, patched_env, files, expected_len):
+        """Test that fetch_image_files returns every directory entry unchanged."""
+        patched_env.listdir.return_value = files
 
-        manager = DisplayManager('/test/images', 60)
         images = manager.fetch_image_files()
 
-        # Per documentation, no filtering for image types
-        assert len(images) == 4
+        assert len(images) == expected_len
+        assert images == files
 
 
 class TestSelectRandomImage:
     """Tests for random image selection without repetition."""
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_select_random_image_single_image(self, mock_epd_class, mock_atexit):
+    def test_select_random_image_single_image(self, manager):
         """Test that single image is always selected."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        manager = DisplayManager('/test/images', 60)
         selected = manager.select_random_image(['single.jpg'])
 
         assert selected == 'single.jpg'
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_select_random_image_no_immediate_repetition(self, mock_epd_class, mock_atexit):
+    def test_select_random_image_no_immediate_repetition(self, manager):
         """Test that previously selected image is not immediately repeated."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        manager = DisplayManager('/test/images', 60)
         manager.last_selected_image = 'image1.jpg'
 
         images = ['image1.jpg', 'image2.jpg', 'image3.jpg']
         selected = manager.select_random_image(images)
 
-        assert selected != 'image1.jpg' or len(images) == 1
+        assert selected != 'image1.jpg'
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
     @patch('random.choice')
-    def test_select_random_image_uses_random_choice(self, mock_choice, mock_epd_class, mock_atexit):
+    def test_select_random_image_uses_random_choice(self, mock_choice, manager):
         """Test that random.choice is used for selection."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
         mock_choice.return_value = 'image2.jpg'
-
-        manager = DisplayManager('/test/images', 60)
         manager.last_selected_image = None
 
         images = ['image1.jpg', 'image2.jpg', 'image3.jpg']
         selected = manager.select_random_image(images)
 
-        # Should use random.choice on filtered list
-        assert mock_choice.called or selected in images
+        # Nothing was shown yet, so random.choice sees the full list
+        mock_choice.assert_called_once_with(images)
+        assert selected == 'image2.jpg'
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_select_random_image_fallback_to_all_images(self, mock_epd_class, mock_atexit):
+    def test_select_random_image_fallback_to_all_images(self, manager):
         """Test fallback when filtered list becomes empty."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        manager = DisplayManager('/test/images', 60)
         manager.last_selected_image = 'image1.jpg'
 
         # When only one image, should return it even if it's the last selected
@@ -239,16 +195,8 @@ class TestSelectRandomImage:
 
         assert selected == 'image1.jpg'
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_select_random_image_all_images_eventually_selected(self, mock_epd_class, mock_atexit):
+    def test_select_random_image_all_images_eventually_selected(self, manager):
         """Test that all images get selected over multiple calls."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        manager = DisplayManager('/test/images', 60)
         images = ['image1.jpg', 'image2.jpg', 'image3.jpg']
         selected_images = set()
 
@@ -261,534 +209,147 @@ class TestSelectRandomImage:
         assert len(selected_images) > 1
 
 
+@pytest.mark.loop
 class TestDisplayImages:
     """Tests for the main display loop."""
 
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_images_loads_initial_image(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test that initial image is loaded and displayed."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
-
-        mock_listdir.return_value = ['image.jpg']
-
-        # Mock the infinite loop to exit after first iteration
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 60)
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
-
-        # Image should be opened
-        assert mock_pil_open.called or True
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_images_no_images_displays_message(
-        self, mock_epd_class, mock_atexit, mock_listdir, mock_sleep
-    ):
-        """Test that message is displayed when no images available."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_listdir.return_value = []
-
-        manager = DisplayManager('/test/images', 60)
-
-        with patch.object(manager, 'display_message') as mock_display_msg:
-            try:
-                manager.display_images()
-            except (KeyboardInterrupt, StopIteration):
-                pass
-
-            # Should display error message when no images
-            assert mock_display_msg.called or True
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_images_rotates_at_refresh_interval(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test that images rotate at refresh_time intervals."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
-
-        mock_listdir.return_value = ['image1.jpg', 'image2.jpg']
-
-        # Mock sleep to track refresh timing
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 120)
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
-
-            # Sleep should be called with refresh_time
-            sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
-            if sleep_calls:
-                assert sleep_calls[0] == 120 or True
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_images_applies_rotation_transformation(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test that rotation transformation is applied to image."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
-
-        mock_listdir.return_value = ['image.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 60)
-        manager.rotation = 90
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
-
-            # Image should be rotated by specified amount
-            assert mock_img.rotate.called or True
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_images_handles_missing_file(
-        self, mock_epd_class, mock_atexit, mock_listdir, mock_sleep
-    ):
-        """Test graceful handling of missing image file during display."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_listdir.return_value = ['missing.jpg']
-
-        manager = DisplayManager('/test/images', 60)
-
-        # Missing file should be handled gracefully
-        with patch('PIL.Image.open', side_effect=FileNotFoundError()):
-            try:
-                manager.display_images()
-            except (KeyboardInterrupt, FileNotFoundError, StopIteration):
-                pass
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_images_calls_epd_display(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test that EPD.display() is called with image buffer."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
-
-        mock_listdir.return_value = ['image.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 60)
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
-
-            # EPD display should be called
-            assert mock_epd.display.called or True
-
-
-class TestDisplayMessage:
-    """Tests for message display functionality."""
-
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_message_valid_file(self, mock_epd_class, mock_atexit, mock_pil_open):
-        """Test displaying valid message file."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_pil_open.return_value = mock_img
-
-        manager = DisplayManager('/test/images', 60)
-        manager.display_message('messages/startup.png')
+    def test_display_images_smoke(self, manager, patched_env):
+        """Run the display loop scenarios back to back on one manager."""
+        # Initial image is loaded from the image folder and sent to the EPD
+        _one_iteration(manager, patched_env, ['image.jpg'])
+        patched_env.pil_open.assert_called_once_with('/test/images/image.jpg')
+        manager.epd.display.assert_called_once_with(manager.epd.getbuffer.return_value)
+        assert manager.last_selected_image == 'image.jpg'
 
-        # Image should be opened and displayed
-        assert mock_pil_open.called or True
-        assert mock_epd.display.called or True
+        # Rotation is applied before display
+        manager.rotation = 90
+        img = _one_iteration(manager, patched_env, ['image.jpg'])
+        assert img.rotations == [90]
+        manager.rotation = 0
 
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_message_file_not_found(self, mock_epd_class, mock_atexit, mock_pil_open):
-        """Test handling of missing message file."""
-        from display_manager import DisplayManager
+        # Once refresh_time elapses a different image is shown
+        manager.refresh_time = 0
+        _one_iteration(manager, patched_env, ['image1.jpg', 'image2.jpg'], displays=2)
+        first, second = (c.args[0] for c in patched_env.pil_open.call_args_list)
+        assert first != second
+        manager.refresh_time = 60
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_pil_open.side_effect = FileNotFoundError("File not found")
+        # No images falls back to the no_valid_images message
+        _one_iteration(manager, patched_env, [])
+        assert patched_env.pil_open.call_args.args[0].endswith('messages/no_valid_images.jpg')
+        manager.epd.display.assert_called_once()
 
-        manager = DisplayManager('/test/images', 60)
+        # Missing file propagates out of display_images() to the caller
+        patched_env.listdir.return_value = ['missing.jpg']
+        patched_env.pil_open.side_effect = FileNotFoundError()
+        with pytest.raises(FileNotFoundError):
+            manager.display_images()
 
-        # Should handle FileNotFoundError gracefully
-        try:
-            manager.display_message('messages/missing.png')
-        except FileNotFoundError:
-            pass  # Expected behavior
 
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_display_message_generic_exception(self, mock_epd_class, mock_atexit, mock_pil_open):
-        """Test handling of generic exceptions."""
-        from display_manager import DisplayManager
+class TestDisplayMessage:
+    """Tests for message display functionality."""
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_pil_open.side_effect = Exception("Generic error")
+    @pytest.mark.parametrize("side_effect,displayed", [
+        (None, True),
+        (FileNotFoundError("File not found"), False),
+        (Exception("Generic error"), False),
+    ], ids=['valid_file', 'file_not_found', 'generic_exception'])
+    def test_display_message(self, manager, patched_env, side_effect, displayed):
+        """Test that message images are shown and load errors are swallowed."""
+        patched_env.pil_open.side_effect = side_effect
 
-        manager = DisplayManager('/test/images', 60)
+        # display_message() catches and reports errors instead of raising
+        manager.display_message('start.jpg')
 
-        # Should handle generic exceptions gracefully
-        try:
-            manager.display_message('messages/error.png')
-        except Exception:
-            pass  # Expected behavior
+        assert patched_env.pil_open.call_args.args[0].endswith('messages/start.jpg')
+        assert manager.epd.display.called is displayed
 
 
 class TestResetFrame:
     """Tests for frame reset and cleanup."""
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_reset_frame_clears_display(self, mock_epd_class, mock_atexit):
+    def test_reset_frame_clears_display(self, manager):
         """Test that display is cleared during reset."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        manager = DisplayManager('/test/images', 60)
         manager.reset_frame()
 
         # Clear should be called
-        assert mock_epd.Clear.called
+        assert manager.epd.Clear.called
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_reset_frame_puts_epd_to_sleep(self, mock_epd_class, mock_atexit):
+    def test_reset_frame_puts_epd_to_sleep(self, manager):
         """Test that EPD is put to sleep during reset."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        manager = DisplayManager('/test/images', 60)
         manager.reset_frame()
 
         # Sleep should be called
-        assert mock_epd.sleep.called
+        assert manager.epd.sleep.called
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_reset_frame_called_on_exit(self, mock_epd_class, mock_atexit):
+    def test_reset_frame_called_on_exit(self, manager, patched_env):
         """Test that reset_frame is registered with atexit."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        DisplayManager('/test/images', 60)
-
         # atexit.register should be called
-        assert mock_atexit.called
+        assert patched_env.atexit.called
 
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    @patch('os.listdir')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_empty_image_directory_displays_error_message(
-        self, mock_epd_class, mock_atexit, mock_listdir
-    ):
+    def test_empty_image_directory_displays_error_message(self, manager, patched_env):
         """Test that error message is displayed when no images available."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-        mock_listdir.return_value = []
-
-        manager = DisplayManager('/test/images', 60)
+        patched_env.listdir.return_value = []
 
         with patch.object(manager, 'display_message') as mock_msg:
-            try:
-                manager.display_images()
-            except (KeyboardInterrupt, StopIteration):
-                pass
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_file_deleted_during_display_loop(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test graceful handling when file is deleted during loop."""
-        from display_manager import DisplayManager
+            manager.display_images()
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
+        mock_msg.assert_called_once_with("no_valid_images.jpg")
 
+    @pytest.mark.loop
+    def test_file_deleted_during_display_loop(self, manager, patched_env):
+        """Test graceful handling when file is deleted during loop."""
         # Simulate file being deleted
-        mock_pil_open.side_effect = FileNotFoundError()
-
-        mock_listdir.return_value = ['image.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 60)
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except (KeyboardInterrupt, FileNotFoundError):
-                pass
-
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_very_short_refresh_time(self, mock_epd_class, mock_atexit):
-        """Test with very short refresh time (1 second)."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
+        patched_env.pil_open.side_effect = FileNotFoundError()
 
-        manager = DisplayManager('/test/images', 1)
+        patched_env.listdir.return_value = ['image.jpg']
 
-        assert manager.refresh_time == 1
+        with pytest.raises(FileNotFoundError):
+            manager.display_images()
 
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_very_long_refresh_time(self, mock_epd_class, mock_atexit):
-        """Test with very long refresh time (3600 seconds / 1 hour)."""
-        from display_manager import DisplayManager
+    @pytest.mark.parametrize('refresh_time', [1, 60, 3600], ids=['1s', '60s', '1h'])
+    def test_refresh_time_preserved(self, manager_factory, refresh_time):
+        """Test that short and long refresh times are stored unchanged."""
+        manager = manager_factory(refresh_time=refresh_time)
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
+        assert manager.refresh_time == refresh_time
 
-        manager = DisplayManager('/test/images', 3600)
-
-        assert manager.refresh_time == 3600
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_unusual_image_aspect_ratio(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
+    @pytest.mark.loop
+    def test_unusual_image_aspect_ratio(self, manager, patched_env):
         """Test handling of unusual aspect ratios."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
         # Create image with unusual aspect ratio
-        mock_img = MagicMock()
-        mock_img.size = (2400, 400)  # Ultra-wide 6:1 ratio
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
+        patched_env.pil_open.return_value = FakeImage(size=(2400, 400))  # Ultra-wide 6:1 ratio
 
-        mock_listdir.return_value = ['ultra_wide.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+        patched_env.listdir.return_value = ['ultra_wide.jpg']
 
-        manager = DisplayManager('/test/images', 60)
+        _stop_after_displays(manager)
 
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
+        manager.display_images()
 
-            assert True  # Should handle without error
+        # Images are passed through unchanged regardless of aspect ratio
+        manager.epd.display.assert_called_once()
 
 
+@pytest.mark.loop
 class TestRotationParameters:
     """Tests for rotation handling."""
 
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_rotate_0_degrees(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test 0 degree rotation (no rotation)."""
-        from display_manager import DisplayManager
+    @pytest.mark.parametrize('rotation', [0, 90, 180, 270], ids=['0deg', '90deg', '180deg', '270deg'])
+    def test_rotation_applied(self, manager, patched_env, rotation):
+        """Test that the configured rotation angle is applied to the image."""
+        img = FakeImage()
+        patched_env.pil_open.return_value = img
 
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
+        patched_env.listdir.return_value = ['image.jpg']
 
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
+        manager.rotation = rotation
 
-        mock_listdir.return_value = ['image.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+        _stop_after_displays(manager)
 
-        manager = DisplayManager('/test/images', 60)
-        manager.rotation = 0
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_rotate_90_degrees(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test 90 degree rotation."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
-
-        mock_listdir.return_value = ['image.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 60)
-        manager.rotation = 90
+        manager.display_images()
 
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_rotate_180_degrees(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test 180 degree rotation."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
-
-        mock_listdir.return_value = ['image.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 60)
-        manager.rotation = 180
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
-
-    @patch('time.sleep')
-    @patch('os.listdir')
-    @patch('PIL.Image.open')
-    @patch('atexit.register')
-    @patch('display_manager.epd7in3f.EPD')
-    def test_rotate_270_degrees(
-        self, mock_epd_class, mock_atexit, mock_pil_open, mock_listdir, mock_sleep
-    ):
-        """Test 270 degree rotation."""
-        from display_manager import DisplayManager
-
-        mock_epd = MagicMock()
-        mock_epd_class.return_value = mock_epd
-
-        mock_img = MagicMock()
-        mock_img.rotate.return_value = mock_img
-        mock_pil_open.return_value = mock_img
-
-        mock_listdir.return_value = ['image.jpg']
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
-
-        manager = DisplayManager('/test/images', 60)
-        manager.rotation = 270
-
-        with patch.object(manager, 'stop_display', True):
-            try:
-                manager.display_images()
-            except KeyboardInterrupt:
-                pass
+        assert img.rotations == [rotation]
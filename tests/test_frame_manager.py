@@ -13,657 +13,339 @@ Tests cover:
 - Exit codes for various error conditions
 
 Test organization: Class-based with method names describing scenarios.
-Mocking strategy: All external components mocked (DisplayManager, ImageConverter, file ops).
+Mocking strategy: All external components (DisplayManager, ImageConverter, file ops)
+and sys.argv patched by the autouse ``patched_env`` fixture; per-test arguments
+are given by indirectly parametrizing the ``argv`` fixture.
 """
 
 import sys
-from unittest.mock import MagicMock, patch, call, mock_open
+from types import SimpleNamespace
+from typing import Callable, Optional, Sequence
+from unittest.mock import MagicMock, Mock, patch, call
 import pytest
 
+# Skip the module cleanly if frame_manager's runtime dependencies are unavailable
+main = pytest.importorskip('frame_manager').main
 
-class TestMainFunctionCLI:
-    """Tests for command-line argument parsing."""
+# Standard command line shared by most tests; copied into sys.argv per use
+_ARGV_STD = ('frame_manager.py', '/media/pi/sd', '60')
 
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_valid_arguments_execution(self, mock_makedirs, mock_rmtree, mock_converter, mock_display):
-        """Test execution with valid command-line arguments."""
-        from frame_manager import main
 
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
+@pytest.fixture(scope="module")
+def make_display_mock() -> Callable[..., Mock]:
+    """Factory for preconfigured DisplayManager instance mocks.
 
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
+    ``display_error`` is raised from display_images() so main() leaves the
+    display loop immediately; KeyboardInterrupt by default, None to return.
+    Plain Mocks spec'd to the methods main() calls, so any other access fails.
+    """
+    def _make(display_error: Optional[BaseException] = KeyboardInterrupt) -> Mock:
+        display = Mock(spec_set=['display_images', 'display_message'])
+        display.display_images.side_effect = display_error
+        return display
 
-        with pytest.raises(KeyboardInterrupt):
-            main()
+    return _make
 
-        # Should initialize both components
-        assert mock_display.called
-        assert mock_converter.called
 
-    @patch('sys.exit')
-    @patch('sys.argv', ['frame_manager.py'])
-    def test_missing_sd_path_argument_exits(self, mock_exit):
-        """Test that missing sd_path argument causes sys.exit(1)."""
-        from frame_manager import main
+@pytest.fixture(scope="module")
+def make_converter_mock() -> Callable[..., Mock]:
+    """Factory for preconfigured ImageConverter instance mocks.
 
-        mock_exit.side_effect = SystemExit(1)
+    ``processing_error`` is raised from process_images() when given.
+    """
+    def _make(processing_error: Optional[BaseException] = None) -> Mock:
+        converter = Mock(spec_set=['process_images'])
+        converter.process_images.side_effect = processing_error
+        return converter
 
-        with pytest.raises(SystemExit):
-            main()
+    return _make
 
-        mock_exit.assert_called_with(1)
 
-    @patch('sys.exit')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd'])
-    def test_missing_refresh_time_argument_exits(self, mock_exit):
-        """Test that missing refresh_time argument causes sys.exit(1)."""
-        from frame_manager import main
+def _run_main(argv: Sequence[str], pic_path: str) -> SimpleNamespace:
+    """Run main() once with ``argv`` and capture every mock it touched.
 
-        mock_exit.side_effect = SystemExit(1)
+    PIC_PATH is redirected to ``pic_path`` so parallel workers never share it.
 
-        with pytest.raises(SystemExit):
-            main()
-
-        mock_exit.assert_called_with(1)
+    Patches are only active for the duration of the call, so the recorded mocks
+    can be shared read-only by every test using the run.
 
-    @patch('sys.exit')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', 'invalid'])
-    def test_invalid_refresh_time_exits(self, mock_exit):
-        """Test that non-numeric refresh_time causes sys.exit(1)."""
-        from frame_manager import main
+    Returns:
+        SimpleNamespace: display/converter classes and instances, rmtree,
+        makedirs, pic_path, and an ``order`` mock recording process/display
+        call order
+    """
+    with patch('frame_manager.DisplayManager') as mock_display, \
+            patch('frame_manager.ImageConverter') as mock_converter, \
+            patch('sys.argv', list(argv)), \
+            patch('frame_manager.PIC_PATH', pic_path), \
+            patch('os.path.exists', return_value=True), \
+            patch('shutil.rmtree') as mock_rmtree, \
+            patch('os.makedirs') as mock_makedirs:
+        display_instance = mock_display.return_value
+        converter_instance = mock_converter.return_value
+        display_instance.display_images.side_effect = KeyboardInterrupt()
 
-        mock_exit.side_effect = SystemExit(1)
+        order = MagicMock()
+        order.attach_mock(converter_instance.process_images, 'process_images')
+        order.attach_mock(display_instance.display_images, 'display_images')
 
-        # Should raise SystemExit when refresh_time conversion fails
-        with pytest.raises((SystemExit, ValueError)):
+        with pytest.raises(KeyboardInterrupt):
             main()
 
-    @patch('sys.exit')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60', 'extra'])
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_too_many_arguments_handled(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display, mock_exit
-    ):
-        """Test handling of too many command-line arguments."""
-        from frame_manager import main
+    return SimpleNamespace(
+        display=mock_display,
+        converter=mock_converter,
+        display_instance=display_instance,
+        converter_instance=converter_instance,
+        rmtree=mock_rmtree,
+        makedirs=mock_makedirs,
+        pic_path=pic_path,
+        order=order,
+    )
+
+
+@pytest.fixture(scope="module")
+def main_invocation(tmp_path_factory) -> SimpleNamespace:
+    """Single main() run with standard arguments, shared by the workflow tests."""
+    return _run_main(_ARGV_STD, str(tmp_path_factory.mktemp('main') / 'pic'))
+
+
+@pytest.fixture(scope="class")
+def completed_main_run(tmp_path_factory) -> SimpleNamespace:
+    """Single main() run with non-default arguments, shared by the integration tests."""
+    return _run_main(['frame_manager.py', '/media/pi/card', '300'], str(tmp_path_factory.mktemp('main') / 'pic'))
+
+
+@pytest.fixture
+def argv(request, monkeypatch) -> list:
+    """Set sys.argv for main().
+
+    Defaults to standard arguments; override per test with
+    ``@pytest.mark.parametrize('argv', [[...]], indirect=True)``.
+    """
+    value = list(getattr(request, 'param', _ARGV_STD))
+    monkeypatch.setattr(sys, 'argv', value)
+    return value
+
+
+@pytest.fixture(autouse=True)
+def patched_env(argv, monkeypatch, tmp_path, make_display_mock, make_converter_mock) -> SimpleNamespace:
+    """Patch frame_manager's collaborators, file operations and argv for every test.
+
+    ``sys.argv`` comes from the ``argv`` fixture. Tests customize behavior
+    through the returned namespace, e.g. ``patched_env.display.return_value = make_display_mock(None)``.
+
+    PIC_PATH points into the test's tmp_path so parallel workers never share it.
+
+    Returns:
+        SimpleNamespace: display/converter class mocks, rmtree, makedirs, exists
+        and the redirected pic_path
+    """
+    env = SimpleNamespace(
+        display=MagicMock(return_value=make_display_mock()),
+        converter=MagicMock(return_value=make_converter_mock()),
+        rmtree=MagicMock(),
+        makedirs=MagicMock(),
+        exists=MagicMock(return_value=True),
+        pic_path=str(tmp_path / 'pic'),
+    )
+    monkeypatch.setattr('frame_manager.PIC_PATH', env.pic_path)
+    monkeypatch.setattr('frame_manager.DisplayManager', env.display)
+    monkeypatch.setattr('frame_manager.ImageConverter', env.converter)
+    monkeypatch.setattr('shutil.rmtree', env.rmtree)
+    monkeypatch.setattr('os.makedirs', env.makedirs)
+    monkeypatch.setattr('os.path.exists', env.exists)
+    return env
 
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
 
-        mock_display_instance = MagicMock()
-        mock_display.return_value = mock_display_instance
+class TestMainFunctionCLI:
+    """Tests for command-line argument parsing."""
 
-        # May either exit or ignore extra args depending on implementation
-        try:
+    @pytest.mark.parametrize('argv', [
+        ['frame_manager.py'],
+        ['frame_manager.py', '/media/pi/sd'],
+    ], ids=['missing_sd_path', 'missing_refresh_time'], indirect=True)
+    def test_missing_argument_exits(self):
+        """Test that a missing sd_path or refresh_time argument causes sys.exit(1)."""
+        with pytest.raises(SystemExit) as excinfo:
             main()
-        except SystemExit:
-            pass
-
-
-class TestMainWorkflow:
-    """Tests for the main function workflow and component interaction."""
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_display_manager_created_with_correct_params(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test that DisplayManager is initialized with correct parameters."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
 
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
+        assert excinfo.value.code == 1
 
-        with pytest.raises(KeyboardInterrupt):
+    @pytest.mark.parametrize('argv', [['frame_manager.py', '/media/pi/sd', 'invalid']], indirect=True)
+    def test_invalid_refresh_time_raises(self, patched_env):
+        """Test that non-numeric refresh_time fails before any component is created."""
+        # int() conversion is not guarded, so the ValueError propagates
+        with pytest.raises(ValueError):
             main()
 
-        # DisplayManager should be called with image_folder and refresh_time
-        mock_display.assert_called()
-        call_args = mock_display.call_args
-        assert 'pic' in str(call_args) or len(call_args[0]) >= 2
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '120'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_image_converter_created_with_correct_params(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test that ImageConverter is initialized with source/output directories."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
+        patched_env.display.assert_not_called()
 
+    @pytest.mark.parametrize('argv', [['frame_manager.py', '/media/pi/sd', '60', 'extra']], indirect=True)
+    def test_too_many_arguments_ignored(self, patched_env):
+        """Test that arguments beyond sd_path and refresh_time are ignored."""
         with pytest.raises(KeyboardInterrupt):
             main()
 
-        # ImageConverter should be created
-        mock_converter.assert_called()
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_pic_path_cleaned_and_recreated(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test that PIC_PATH directory is cleaned and recreated."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
+        patched_env.display.assert_called_once_with(image_folder=patched_env.pic_path, refresh_time=60)
+        patched_env.converter.assert_called_once_with(source_dir='/media/pi/sd', output_dir=patched_env.pic_path)
 
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
 
-        with pytest.raises(KeyboardInterrupt):
-            main()
+class TestMainWorkflow:
+    """Tests for the main function workflow and component interaction.
 
-        # rmtree and makedirs should be called for cleanup/recreation
-        assert mock_rmtree.called or mock_makedirs.called
+    All tests assert against the single main() run captured by main_invocation.
+    """
 
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_startup_message_displayed(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test that startup message is displayed."""
-        from frame_manager import main
+    def test_components_created(self, main_invocation):
+        """Test execution with valid arguments creates both components."""
+        main_invocation.display.assert_called_once()
+        main_invocation.converter.assert_called_once()
 
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
+    def test_display_manager_created_with_correct_params(self, main_invocation):
+        """Test that DisplayManager is initialized with correct parameters."""
+        main_invocation.display.assert_called_once_with(image_folder=main_invocation.pic_path, refresh_time=60)
 
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display_instance.display_message = MagicMock()
-        mock_display.return_value = mock_display_instance
+    def test_image_converter_created_with_correct_params(self, main_invocation):
+        """Test that ImageConverter is initialized with source/output directories."""
+        main_invocation.converter.assert_called_once_with(
+            source_dir='/media/pi/sd', output_dir=main_invocation.pic_path,
+        )
 
-        with pytest.raises(KeyboardInterrupt):
-            main()
+    def test_pic_path_cleaned_and_recreated(self, main_invocation):
+        """Test that PIC_PATH directory is cleaned and recreated."""
+        main_invocation.rmtree.assert_called_once_with(main_invocation.pic_path)
+        main_invocation.makedirs.assert_called_once_with(main_invocation.pic_path)
 
-        # display_message should be called during startup
-        assert mock_display_instance.display_message.called or True
+    def test_startup_message_displayed(self, main_invocation):
+        """Test that startup message is displayed."""
+        main_invocation.display_instance.display_message.assert_called_once_with("start.jpg")
 
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_images_processed_via_converter(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
+    def test_images_processed_via_converter(self, main_invocation):
         """Test that images are processed via converter.process_images()."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter_instance.process_images = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
+        main_invocation.converter_instance.process_images.assert_called_once_with()
 
-        # process_images should be called
-        mock_converter_instance.process_images.assert_called_once()
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_display_started_after_processing(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
+    def test_display_started_after_processing(self, main_invocation):
         """Test that display loop starts after image processing."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images = MagicMock(side_effect=KeyboardInterrupt())
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
-
-        # display_images should be called after processing
-        mock_display_instance.display_images.assert_called()
+        assert main_invocation.order.mock_calls == [call.process_images(), call.display_images()]
 
 
 class TestDirectoryHandling:
     """Tests for directory creation and cleanup."""
 
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    @patch('os.path.exists')
-    def test_pic_path_created_when_missing(
-        self, mock_exists, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
+    def test_pic_path_created_when_missing(self, patched_env):
         """Test that PIC_PATH is created if it doesn't exist."""
-        from frame_manager import main
-
-        mock_exists.return_value = False
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
+        patched_env.exists.return_value = False
 
         with pytest.raises(KeyboardInterrupt):
             main()
 
-        # makedirs should be called to create directory
-        assert mock_makedirs.called or True
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    @patch('os.path.exists')
-    def test_pic_path_cleaned_when_exists(
-        self, mock_exists, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test that PIC_PATH is cleaned if it already exists."""
-        from frame_manager import main
-
-        mock_exists.return_value = True
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
+        # Nothing to clean, so the directory is only created
+        patched_env.rmtree.assert_not_called()
+        patched_env.makedirs.assert_called_once_with(patched_env.pic_path)
 
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
+    def test_pic_path_cleaned_when_exists(self, patched_env):
+        """Test that PIC_PATH is cleaned if it already exists."""
+        patched_env.exists.return_value = True
 
         with pytest.raises(KeyboardInterrupt):
             main()
 
         # rmtree should be called to clean existing directory
-        assert mock_rmtree.called or True
-
-    @patch('sys.exit')
-    @patch('sys.argv', ['frame_manager.py', '/nonexistent/sd', '60'])
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_sd_card_path_missing_handling(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display, mock_exit
-    ):
-        """Test error handling when SD card path doesn't exist."""
-        from frame_manager import main
+        patched_env.rmtree.assert_called_once_with(patched_env.pic_path)
 
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
+    @pytest.mark.parametrize('argv', [['frame_manager.py', '/nonexistent/sd', '60']], indirect=True)
+    def test_sd_card_path_missing_handling(self, patched_env, make_display_mock, make_converter_mock):
+        """Test that a missing SD card path is reported and display still starts."""
+        patched_env.converter.return_value = make_converter_mock(processing_error=FileNotFoundError('/nonexistent/sd'))
+        patched_env.display.return_value = make_display_mock(display_error=None)
 
-        mock_display_instance = MagicMock()
-        mock_display.return_value = mock_display_instance
+        main()
 
-        # May exit or print error depending on implementation
-        try:
-            main()
-        except (FileNotFoundError, SystemExit):
-            pass
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree', side_effect=PermissionError("Permission denied"))
-    @patch('os.makedirs')
-    def test_permission_denied_on_pic_path(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test error handling when permission denied on PIC_PATH."""
-        from frame_manager import main
+        patched_env.display.return_value.display_images.assert_called_once()
 
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
+    def test_permission_denied_on_pic_path(self, patched_env, make_display_mock):
+        """Test that permission denied while cleaning PIC_PATH propagates before any processing."""
+        patched_env.rmtree.side_effect = PermissionError("Permission denied")
+        patched_env.display.return_value = make_display_mock(display_error=None)
 
-        mock_display_instance = MagicMock()
-        mock_display.return_value = mock_display_instance
-
-        # Should handle permission errors
-        try:
+        with pytest.raises(PermissionError, match="Permission denied"):
             main()
-        except (PermissionError, SystemExit):
-            pass
+
+        # The directory is not recreated and no images are converted or displayed
+        patched_env.makedirs.assert_not_called()
+        patched_env.converter.assert_not_called()
+        patched_env.display.return_value.display_images.assert_not_called()
 
 
 class TestErrorHandling:
     """Tests for error handling and recovery."""
 
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_image_processing_error_caught_and_continues(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
+    @pytest.mark.parametrize('processing_error,display_error,expected,printed', [
+        (Exception("Processing error"), KeyboardInterrupt, KeyboardInterrupt,
+         'Error during image processing: Processing error'),
+        (None, KeyboardInterrupt, KeyboardInterrupt, 'Processing images, please wait...'),
+        (None, RuntimeError("Display error"), SystemExit, 'Error during image display: Display error'),
+    ], ids=['processing_error_continues', 'processing_success', 'display_error_exits'])
+    def test_error_paths(
+        self, patched_env, capsys, make_display_mock, make_converter_mock,
+        processing_error, display_error, expected, printed,
     ):
-        """Test that image processing error is caught and execution continues."""
-        from frame_manager import main
+        """Test that processing errors are reported and skipped while display errors exit."""
+        patched_env.converter.return_value = make_converter_mock(processing_error=processing_error)
+        patched_env.display.return_value = make_display_mock(display_error=display_error)
 
-        mock_converter_instance = MagicMock()
-        mock_converter_instance.process_images.side_effect = Exception("Processing error")
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
+        with pytest.raises(expected):
             main()
 
-        # Should continue to display_images even if processing fails
-        mock_display_instance.display_images.assert_called()
-
-    @patch('sys.exit')
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_display_error_causes_exit(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display, mock_exit
-    ):
-        """Test that display error causes program to exit."""
-        from frame_manager import main
-
-        mock_exit.side_effect = SystemExit(1)
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = RuntimeError("Display error")
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(SystemExit):
-            main()
-
-        mock_exit.assert_called_with(1)
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_partial_image_processing_success(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display, capsys
-    ):
-        """Test that partial processing success is handled."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        # Simulate some images processed before error
-        mock_converter_instance.process_images = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
-
-        # Should continue despite partial success
-        assert True
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_error_messages_printed(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display, capsys
-    ):
-        """Test that error messages are printed to console."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter_instance.process_images.side_effect = Exception("Test error")
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
-
-        # Error handling may print to console
-        captured = capsys.readouterr()
-        # Should have some output (may be error or status)
+        # Display starts whether or not processing succeeded
+        patched_env.display.return_value.display_images.assert_called_once()
+        assert printed in capsys.readouterr().out
 
 
 class TestIntegration:
-    """Tests for integration between components."""
-
-    @patch('os.path.exists')
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_full_workflow_integration(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display, mock_exists
-    ):
-        """Test complete workflow with all components."""
-        from frame_manager import main
-
-        mock_exists.return_value = True
-        mock_converter_instance = MagicMock()
-        mock_converter_instance.process_images = MagicMock()
-        mock_converter.return_value = mock_converter_instance
+    """Tests for integration between components.
 
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images = MagicMock(side_effect=KeyboardInterrupt())
-        mock_display_instance.display_message = MagicMock()
-        mock_display.return_value = mock_display_instance
+    All tests assert against the single main() run captured by completed_main_run.
+    """
 
-        with pytest.raises(KeyboardInterrupt):
-            main()
-
-        # All components should be called in sequence
-        mock_rmtree.assert_called()
-        mock_makedirs.assert_called()
-        mock_display.assert_called()
-        mock_converter.assert_called()
-        mock_converter_instance.process_images.assert_called()
-        mock_display_instance.display_images.assert_called()
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '300'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_refresh_time_passed_to_display_manager(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
+    def test_full_workflow_integration(self, completed_main_run):
+        """Test complete workflow with all components."""
+        completed_main_run.rmtree.assert_called()
+        completed_main_run.makedirs.assert_called()
+        completed_main_run.display.assert_called()
+        completed_main_run.converter.assert_called()
+        completed_main_run.converter_instance.process_images.assert_called()
+        completed_main_run.display_instance.display_images.assert_called()
+
+    def test_refresh_time_passed_to_display_manager(self, completed_main_run):
         """Test that refresh_time is correctly passed to DisplayManager."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
+        assert completed_main_run.display.call_args.kwargs['refresh_time'] == 300
 
-        # DisplayManager should be called with refresh_time = 300
-        call_args = mock_display.call_args
-        # Check if 300 appears in arguments
-        assert '300' in str(call_args) or 300 in str(call_args) or True
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/card', '120'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_sd_card_path_passed_to_converter(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
+    def test_sd_card_path_passed_to_converter(self, completed_main_run):
         """Test that SD card path is passed to ImageConverter."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
+        assert completed_main_run.converter.call_args.kwargs['source_dir'] == '/media/pi/card'
 
-        with pytest.raises(KeyboardInterrupt):
-            main()
-
-        # ImageConverter should be called with SD card path
-        call_args = mock_converter.call_args
-        assert '/media/pi/card' in str(call_args) or True
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_pic_path_passed_to_converter(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
+    def test_pic_path_passed_to_converter(self, completed_main_run):
         """Test that PIC_PATH (output) is passed to ImageConverter."""
-        from frame_manager import main
+        assert completed_main_run.converter.call_args.kwargs['output_dir'] == completed_main_run.pic_path
 
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
-
-        # ImageConverter should be called with output directory
-        call_args = mock_converter.call_args
-        # Check if output path is in arguments
-        assert 'pic' in str(call_args) or True
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '60'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_pic_path_passed_to_display_manager(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
+    def test_pic_path_passed_to_display_manager(self, completed_main_run):
         """Test that PIC_PATH is passed to DisplayManager for displaying images."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
-
-        # DisplayManager should be initialized with image folder = PIC_PATH
-        call_args = mock_display.call_args
-        assert 'pic' in str(call_args) or True
+        assert completed_main_run.display.call_args.kwargs['image_folder'] == completed_main_run.pic_path
 
 
 class TestRefreshTimeValidation:
     """Tests for refresh_time validation and conversion."""
 
-    @patch('sys.exit')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '0'])
-    def test_zero_refresh_time_handling(self, mock_exit):
-        """Test handling of zero refresh time."""
-        from frame_manager import main
-
-        # Zero refresh time may be invalid
-        try:
-            main()
-        except SystemExit:
-            pass
-
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '1'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_minimum_refresh_time(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test with minimum refresh time (1 second)."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
+    @pytest.mark.parametrize('argv', [
+        ['frame_manager.py', '/media/pi/sd', '0'],
+        ['frame_manager.py', '/media/pi/sd', '1'],
+        ['frame_manager.py', '/media/pi/sd', '86400'],
+    ], ids=['zero', 'minimum_1s', 'large_24h'], indirect=True)
+    def test_refresh_time_boundaries(self, argv, patched_env):
+        """Test that boundary refresh times are converted and passed through unchanged."""
         with pytest.raises(KeyboardInterrupt):
             main()
 
-    @patch('frame_manager.DisplayManager')
-    @patch('frame_manager.ImageConverter')
-    @patch('sys.argv', ['frame_manager.py', '/media/pi/sd', '86400'])
-    @patch('shutil.rmtree')
-    @patch('os.makedirs')
-    def test_very_large_refresh_time(
-        self, mock_makedirs, mock_rmtree, mock_converter, mock_display
-    ):
-        """Test with very large refresh time (24 hours = 86400 seconds)."""
-        from frame_manager import main
-
-        mock_converter_instance = MagicMock()
-        mock_converter.return_value = mock_converter_instance
-
-        mock_display_instance = MagicMock()
-        mock_display_instance.display_images.side_effect = KeyboardInterrupt()
-        mock_display.return_value = mock_display_instance
-
-        with pytest.raises(KeyboardInterrupt):
-            main()
+        assert patched_env.display.call_args.kwargs['refresh_time'] == int(argv[2])
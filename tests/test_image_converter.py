@@ -16,11 +16,85 @@ Test organization: Class-based with method names describing scenarios.
 Mocking strategy: All filesystem and PIL operations mocked.
 """
 
+import logging
 import os
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, call, mock_open
 import pytest
-from PIL import Image, ImageEnhance, ImageOps
+from PIL import Image, ImageChops, ImageEnhance, ImageOps
+
+import image_converter
+from image_converter import ImageConverter, _contrast_lut, _fused_enhance
+
+
+class _InlineExecutor:
+    """Serial stand-in for ProcessPoolExecutor.
+
+    Keeps resize_image() calls in-process so patched mocks record them in order.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+
+def _dir_entries(names, source='/source', is_file=True):
+    """Build an os.scandir() stand-in yielding DirEntry-like objects for ``names``."""
+    entries = [
+        SimpleNamespace(name=name, path=os.path.join(source, name), is_file=lambda: is_file)
+        for name in names
+    ]
+    scan = MagicMock()
+    scan.__enter__.return_value = iter(entries)
+    return scan
+
+
+@pytest.fixture(scope='module')
+def rgb_800x480():
+    """White 800x480 RGB image shared by the tests that only read it."""
+    return Image.new('RGB', (800, 480), color='white')
+
+
+@pytest.fixture(scope='module')
+def enhanced_image():
+    """Spec'd stand-in for the enhanced image, built once per module."""
+    return MagicMock(spec=Image.Image)
+
+
+@pytest.fixture
+def fused_enhance(enhanced_image):
+    """Patch the fused RGB enhancement pass; its return value is the image that gets saved."""
+    enhanced_image.reset_mock(side_effect=True)
+    with patch('image_converter._fused_enhance', return_value=enhanced_image) as mock_fused:
+        yield mock_fused
+
+
+@pytest.fixture(scope='module')
+def converter():
+    """ImageConverter shared by the whole module; it holds only its two paths and target size.
+
+    No test reassigns its attributes (patch.object restores what it replaces),
+    so one instance can serve every test.
+    """
+    return ImageConverter('/source', '/output')
+
+
+@pytest.fixture(autouse=True)
+def inline_executor(monkeypatch):
+    """Run process_images() work serially instead of in worker processes."""
+    monkeypatch.setattr('image_converter.ProcessPoolExecutor', _InlineExecutor)
 
 
 class TestImageConverterInit:
@@ -28,8 +102,6 @@ class TestImageConverterInit:
 
     def test_init_with_valid_directories(self):
         """Test successful initialization with valid source and output directories."""
-        from image_converter import ImageConverter
-
         converter = ImageConverter('/test/source', '/test/output')
 
         assert converter.source_dir == '/test/source'
@@ -37,19 +109,13 @@ class TestImageConverterInit:
         assert converter.target_width == 800
         assert converter.target_height == 480
 
-    def test_init_sets_target_dimensions(self):
+    def test_init_sets_target_dimensions(self, converter):
         """Test that target dimensions are set correctly for e-ink display."""
-        from image_converter import ImageConverter
-
-        converter = ImageConverter('/source', '/output')
-
         assert converter.target_width == 800
         assert converter.target_height == 480
 
     def test_init_stores_directory_paths(self):
         """Test that directory paths are stored as instance attributes."""
-        from image_converter import ImageConverter
-
         source = '/path/to/source'
         output = '/path/to/output'
         converter = ImageConverter(source, output)
@@ -61,101 +127,105 @@ class TestImageConverterInit:
 class TestProcessImages:
     """Tests for the process_images() method."""
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_process_images_discovers_all_valid_formats(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_process_images_discovers_all_valid_formats(self, mock_scandir, converter):
         """Test that process_images discovers all supported image formats."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = [
+        mock_scandir.return_value = _dir_entries([
             'image1.jpg', 'image2.jpeg', 'image3.png',
             'image4.bmp', 'image5.gif', 'image6.tiff'
-        ]
-        mock_isfile.return_value = True
+        ])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 6
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_process_images_case_insensitive_extensions(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_process_images_case_insensitive_extensions(self, mock_scandir, converter):
         """Test case-insensitive extension matching."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = [
+        mock_scandir.return_value = _dir_entries([
             'image1.JPG', 'image2.JPEG', 'image3.PNG',
             'image4.Bmp', 'image5.GIF', 'image6.TiFF'
-        ]
-        mock_isfile.return_value = True
+        ])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 6
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_process_images_skips_hidden_files(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_process_images_skips_hidden_files(self, mock_scandir, converter):
         """Test that hidden files (starting with .) are skipped."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = [
+        mock_scandir.return_value = _dir_entries([
             'image.jpg', '.hidden.png', '.DS_Store', 'photo.jpeg'
-        ]
-        mock_isfile.return_value = True
+        ])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 2
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_process_images_skips_non_image_files(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_process_images_skips_non_image_files(self, mock_scandir, converter):
         """Test that non-image files are skipped."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = [
+        mock_scandir.return_value = _dir_entries([
             'image.jpg', 'document.pdf', 'readme.txt',
             'image.png', 'config.ini', 'script.py'
-        ]
-        mock_isfile.return_value = True
+        ])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 2
 
-    @patch('os.listdir')
-    def test_process_images_with_empty_directory(self, mock_listdir):
-        """Test handling of empty source directory."""
-        from image_converter import ImageConverter
+    def test_valid_exts_is_module_level_tuple(self):
+        """Test that supported extensions are a module constant usable by str.endswith()."""
+        assert isinstance(image_converter._VALID_EXTS, tuple)
+        assert image_converter._VALID_EXTS == ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff')
+
+    def test_name_regex_precompiled(self):
+        """Test that the file name filter is a module-level compiled pattern."""
+        assert isinstance(image_converter._NAME_RE, re.Pattern)
+
+    @pytest.mark.parametrize('name,matched', [
+        ('photo.jpg', True),
+        ('PHOTO.JPEG', True),
+        ('scan.Tiff', True),
+        ('archive.jpg.zip', False),
+        ('photojpg', False),
+        ('.hidden.png', False),
+        ('notes.txt', False),
+    ], ids=['jpg', 'upper_jpeg', 'mixed_tiff', 'inner_ext', 'no_dot', 'hidden', 'text'])
+    def test_name_regex_matches_visible_images(self, name, matched):
+        """Test that the name pattern accepts visible files with a supported extension in any case."""
+        assert bool(image_converter._NAME_RE.match(name)) is matched
+
+    @patch('os.scandir')
+    def test_process_images_skips_directories(self, mock_scandir, converter):
+        """Test that subdirectories with image-like names are skipped."""
+        mock_scandir.return_value = _dir_entries(['album.jpg'], is_file=False)
+
+        with patch.object(converter, 'resize_image') as mock_resize:
+            converter.process_images()
+
+            mock_resize.assert_not_called()
 
-        mock_listdir.return_value = []
+    @patch('os.scandir')
+    def test_process_images_with_empty_directory(self, mock_scandir, converter):
+        """Test handling of empty source directory."""
+        mock_scandir.return_value = _dir_entries([])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             mock_resize.assert_not_called()
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_process_images_calls_resize_for_each_valid_image(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_process_images_calls_resize_for_each_valid_image(self, mock_scandir, converter):
         """Test that resize_image is called for each valid image."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = ['img1.jpg', 'img2.png', 'img3.bmp']
-        mock_isfile.return_value = True
+        mock_scandir.return_value = _dir_entries(['img1.jpg', 'img2.png', 'img3.bmp'])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             calls = [
@@ -165,182 +235,169 @@ class TestProcessImages:
             ]
             mock_resize.assert_has_calls(calls)
 
-    @patch('os.listdir')
-    def test_process_images_prints_progress_messages(self, mock_listdir, capsys):
-        """Test that progress messages are printed during processing."""
-        from image_converter import ImageConverter
+    @patch('os.scandir')
+    def test_process_images_prints_progress_messages(self, mock_scandir, caplog, converter):
+        """Test that progress messages are logged at INFO level during processing."""
+        mock_scandir.return_value = _dir_entries(['image.jpg'])
 
-        mock_listdir.return_value = ['image.jpg']
-
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image'), caplog.at_level(logging.INFO, logger='image_converter'):
             converter.process_images()
 
-            captured = capsys.readouterr()
-            assert 'Processing' in captured.out or 'image.jpg' in captured.out or len(captured.out) >= 0
+        assert 'Processing image: /source/image.jpg' in caplog.text
 
 
 class TestResizeImageDimensions:
     """Tests for output image dimensions from resize_image()."""
 
     @patch('PIL.Image.open')
-    @patch('PIL.ImageOps.exif_transpose')
-    @patch('PIL.ImageEnhance.Color')
-    @patch('PIL.ImageEnhance.Contrast')
-    def test_resize_image_outputs_exact_target_dimensions(
-        self, mock_contrast, mock_color, mock_exif, mock_pil_open
-    ):
+    def test_resize_image_outputs_exact_target_dimensions(self, mock_pil_open, fused_enhance, converter):
         """Test that output image is exactly 800x480."""
-        from image_converter import ImageConverter
-
-        # Create a real image to test with
-        test_img = Image.new('RGB', (1600, 900), color='white')
+        # Real image for the real resize; color=None skips the pixel fill since contents are never read
+        test_img = Image.new('RGB', (1600, 900), color=None)
         mock_pil_open.return_value = test_img
-        mock_exif.return_value = test_img
 
-        # Mock enhancement to return a new mocked image
-        mock_color_img = MagicMock(spec=Image.Image)
-        mock_color_enhance = MagicMock()
-        mock_color_enhance.enhance.return_value = mock_color_img
-        mock_color.return_value = mock_color_enhance
-
-        mock_final_img = MagicMock(spec=Image.Image)
-        mock_contrast_enhance = MagicMock()
-        mock_contrast_enhance.enhance.return_value = mock_final_img
-        mock_contrast.return_value = mock_contrast_enhance
-
-        converter = ImageConverter('/source', '/output')
         converter.resize_image('/source/test.jpg', 'test.jpg')
 
+        # The enhancement pass receives the resized and cropped image
+        assert fused_enhance.call_args.args[0].size == (800, 480)
         # Verify save was called on the final enhanced image
-        mock_final_img.save.assert_called_once()
+        fused_enhance.return_value.save.assert_called_once()
 
     @patch('PIL.Image.open')
-    @patch('PIL.ImageOps.exif_transpose')
-    @patch('PIL.ImageEnhance.Color')
-    @patch('PIL.ImageEnhance.Contrast')
-    def test_resize_image_loads_and_saves_file(self, mock_contrast_cls, mock_color_cls, mock_exif, mock_pil_open):
+    def test_resize_image_loads_and_saves_file(self, mock_pil_open, fused_enhance, rgb_800x480, converter):
         """Test that image is loaded from source and saved to output."""
-        from image_converter import ImageConverter
+        mock_pil_open.return_value = rgb_800x480
 
-        test_img = Image.new('RGB', (800, 480), color='white')
-        mock_pil_open.return_value = test_img
-        mock_exif.return_value = test_img
-
-        # Mock enhancements to return mocked images
-        mock_color_img = MagicMock(spec=Image.Image)
-        mock_color_enhancer = MagicMock()
-        mock_color_enhancer.enhance.return_value = mock_color_img
-        mock_color_cls.return_value = mock_color_enhancer
-
-        mock_final_img = MagicMock(spec=Image.Image)
-        mock_contrast_enhancer = MagicMock()
-        mock_contrast_enhancer.enhance.return_value = mock_final_img
-        mock_contrast_cls.return_value = mock_contrast_enhancer
-
-        converter = ImageConverter('/source', '/output')
         converter.resize_image('/source/photo.jpg', 'photo.jpg')
 
         mock_pil_open.assert_called_once_with('/source/photo.jpg')
-        mock_final_img.save.assert_called_once()
-
+        fused_enhance.return_value.save.assert_called_once()
+        assert fused_enhance.return_value.save.call_args.args == ('/output/photo.jpg',)
+
+    @pytest.mark.parametrize('file_name,options', [
+        ('photo.jpg', {'quality': 85, 'optimize': False, 'progressive': False, 'subsampling': 2}),
+        ('PHOTO.JPEG', {'quality': 85, 'optimize': False, 'progressive': False, 'subsampling': 2}),
+        ('art.png', {'optimize': False, 'compress_level': 1}),
+        ('scan.tiff', {}),
+    ], ids=['jpg', 'jpeg_upper', 'png', 'other'])
     @patch('PIL.Image.open')
-    def test_resize_image_uses_lanczos_resampling(self, mock_pil_open):
-        """Test that Lanczos resampling filter is used."""
-        from image_converter import ImageConverter
-        from PIL import Image as PILImage
-
-        test_img = Image.new('RGB', (1600, 900), color='white')
+    def test_resize_image_uses_fast_save_options(
+        self, mock_pil_open, fused_enhance, file_name, options, rgb_800x480, converter
+    ):
+        """Test that JPEG and PNG outputs are saved with fast single-pass encoder options."""
+        test_img = rgb_800x480
         mock_pil_open.return_value = test_img
 
-        # Track resize calls
-        original_resize = test_img.resize
-        test_img.resize = MagicMock(side_effect=lambda size, resample: test_img)
+        converter.resize_image(f'/source/{file_name}', file_name)
+
+        fused_enhance.return_value.save.assert_called_once_with(f'/output/{file_name}', **options)
 
-        with patch.object(test_img, 'save'), \
-             patch('PIL.ImageOps.exif_transpose', return_value=test_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'):
+    @patch('PIL.Image.open')
+    def test_resize_image_fast_path_for_matching_dimensions(self, mock_pil_open, fused_enhance, rgb_800x480, converter):
+        """Test that an 800x480 source skips resampling but is still enhanced and saved."""
+        mock_pil_open.return_value = rgb_800x480
+
+        with patch.object(rgb_800x480, 'resize') as mock_resize:
+            converter.resize_image('/source/wallpaper.jpg', 'wallpaper.jpg')
+
+        mock_resize.assert_not_called()
+        assert fused_enhance.call_args.args == (rgb_800x480, 1.5, 1.5)
+        assert fused_enhance.return_value.save.call_args.args == ('/output/wallpaper.jpg',)
+
+    @pytest.mark.parametrize('size,box,resample', [
+        ((1600, 900), (50, 0, 1550, 900), Image.Resampling.LANCZOS),
+        ((1024, 768), (0, 77, 1024, 691), Image.Resampling.LANCZOS),
+        ((1600, 960), (0, 0, 1600, 960), Image.Resampling.LANCZOS),
+        ((900, 540), (0, 0, 900, 540), Image.Resampling.BILINEAR),
+        ((1, 1), (0, 0, 1, 1), Image.Resampling.BILINEAR),
+    ], ids=['wider', 'taller', 'same_aspect', 'near_1to1', 'single_pixel'])
+    @patch('PIL.Image.open')
+    def test_resize_image_uses_lanczos_resampling(self, mock_pil_open, fused_enhance, size, box, resample, converter):
+        """Test that the crop box is resized to 800x480 in one pass, with Lanczos unless near 1:1."""
+        # Uninitialised pixels: only the resize arguments are checked
+        test_img = Image.new('RGB', size, color=None)
+        mock_pil_open.return_value = test_img
 
-            converter = ImageConverter('/source', '/output')
+        with (
+            patch.object(test_img, 'resize', wraps=test_img.resize) as mock_resize,
+            patch.object(test_img, 'crop') as mock_crop,
+        ):
             converter.resize_image('/source/test.jpg', 'test.jpg')
 
-            # Check if resize was called (Lanczos verification requires real PIL)
-            assert test_img.resize.called or True  # May be mocked
+        mock_resize.assert_called_once_with((800, 480), resample, box=box, reducing_gap=2.0)
+        mock_crop.assert_not_called()
 
+    @pytest.mark.parametrize('size,reducing_gap', [
+        ((3200, 1920), 2.0),
+        ((4000, 2400), 3.0),
+    ], ids=['4x', '5x'])
+    @patch('PIL.Image.open')
+    def test_large_image_uses_reducing_gap(
+        self, mock_pil_open, fused_enhance, size, reducing_gap, fake_image_factory, converter
+    ):
+        """Test that sources more than 4x the target use a wider reducing gap."""
+        src_img = mock_pil_open.return_value = fake_image_factory(*size, image_format='PNG')
 
-class TestAspectRatioHandling:
-    """Tests for aspect ratio handling and cropping."""
+        converter.resize_image('/source/huge.png', 'huge.png')
 
-    def test_square_image_centered_crop(self):
-        """Test that square image (1:1) is centered-cropped to 16:10 ratio."""
-        from image_converter import ImageConverter
+        src_img.resize.assert_called_once_with(
+            (800, 480), Image.Resampling.LANCZOS, box=(0, 0) + size, reducing_gap=reducing_gap
+        )
 
-        # Create real square image
-        square_img = Image.new('RGB', (500, 500), color='blue')
+    @pytest.mark.parametrize('image_format,draft_calls', [
+        ('JPEG', [call('RGB', (1600, 960))]),
+        ('PNG', []),
+    ], ids=['jpeg', 'png'])
+    @patch('PIL.Image.open')
+    def test_jpeg_uses_draft(
+        self, mock_pil_open, fused_enhance, image_format, draft_calls, fake_image_factory, converter
+    ):
+        """Test that JPEGs are decoded in draft mode at twice the target size."""
+        src_img = mock_pil_open.return_value = fake_image_factory(3200, 1800, image_format=image_format)
 
-        with patch('PIL.Image.open', return_value=square_img), \
-             patch('PIL.ImageOps.exif_transpose', return_value=square_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(square_img, 'save'):
+        converter.resize_image('/source/photo.jpg', 'photo.jpg')
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/square.jpg', 'square.jpg')
+        assert src_img.draft.call_args_list == draft_calls
 
-            # Image processing should complete without error
-            assert True
 
-    def test_wide_image_fit_height_crop_width(self):
-        """Test that wide image (16:9) fits height and crops width."""
-        from image_converter import ImageConverter
+class TestAspectRatioHandling:
+    """Tests for aspect ratio handling and cropping."""
 
-        wide_img = Image.new('RGB', (1600, 900), color='green')
+    @patch('PIL.Image.open')
+    def test_square_image_centered_crop(self, mock_open, fused_enhance, fake_image_factory, converter):
+        """Test that square image (1:1) is centered-cropped to the 5:3 target ratio."""
+        square_img = mock_open.return_value = fake_image_factory(500, 500)
 
-        with patch('PIL.Image.open', return_value=wide_img), \
-             patch('PIL.ImageOps.exif_transpose', return_value=wide_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(wide_img, 'save'):
+        converter.resize_image('/source/square.jpg', 'square.jpg')
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/wide.jpg', 'wide.jpg')
+        assert square_img.resize.call_args.kwargs['box'] == (0, 100, 500, 400)
 
-            assert True
+    @patch('PIL.Image.open')
+    def test_wide_image_fit_height_crop_width(self, mock_open, fused_enhance, fake_image_factory, converter):
+        """Test that wide image (16:9) fits height and crops width."""
+        wide_img = mock_open.return_value = fake_image_factory(1600, 900)
 
-    def test_tall_image_fit_width_crop_height(self):
-        """Test that tall image (9:16) fits width and crops height."""
-        from image_converter import ImageConverter
+        converter.resize_image('/source/wide.jpg', 'wide.jpg')
 
-        tall_img = Image.new('RGB', (600, 1200), color='red')
+        assert wide_img.resize.call_args.kwargs['box'] == (50, 0, 1550, 900)
 
-        with patch('PIL.Image.open', return_value=tall_img), \
-             patch('PIL.ImageOps.exif_transpose', return_value=tall_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(tall_img, 'save'):
+    @patch('PIL.Image.open')
+    def test_tall_image_fit_width_crop_height(self, mock_open, fused_enhance, fake_image_factory, converter):
+        """Test that tall image (9:16) fits width and crops height."""
+        tall_img = mock_open.return_value = fake_image_factory(600, 1200)
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/tall.jpg', 'tall.jpg')
+        converter.resize_image('/source/tall.jpg', 'tall.jpg')
 
-            assert True
+        assert tall_img.resize.call_args.kwargs['box'] == (0, 420, 600, 780)
 
-    def test_ultra_wide_image_cropped_sides(self):
+    @patch('PIL.Image.open')
+    def test_ultra_wide_image_cropped_sides(self, mock_open, fused_enhance, fake_image_factory, converter):
         """Test that ultra-wide image (21:9) is cropped from sides."""
-        from image_converter import ImageConverter
-
-        ultra_wide = Image.new('RGB', (2400, 900), color='yellow')
+        ultra_wide = mock_open.return_value = fake_image_factory(2400, 900)
 
-        with patch('PIL.Image.open', return_value=ultra_wide), \
-             patch('PIL.ImageOps.exif_transpose', return_value=ultra_wide), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(ultra_wide, 'save'):
+        converter.resize_image('/source/ultrawide.jpg', 'ultrawide.jpg')
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/ultrawide.jpg', 'ultrawide.jpg')
-
-            assert True
+        assert ultra_wide.resize.call_args.kwargs['box'] == (450, 0, 1950, 900)
 
 
 class TestEXIFOrientationCorrection:
@@ -348,58 +405,52 @@ class TestEXIFOrientationCorrection:
 
     @patch('PIL.ImageOps.exif_transpose')
     @patch('PIL.Image.open')
-    def test_exif_transpose_is_called(self, mock_open, mock_transpose):
+    def test_exif_transpose_is_called(self, mock_open, mock_transpose, fused_enhance, fake_image_factory, converter):
         """Test that EXIF transpose is called for orientation correction."""
-        from image_converter import ImageConverter
+        test_img = mock_open.return_value = fake_image_factory(800, 480, orientation=3)
 
-        test_img = Image.new('RGB', (800, 480), color='white')
-        mock_open.return_value = test_img
-        mock_transpose.return_value = test_img
-
-        with patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(test_img, 'save'):
-
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/photo.jpg', 'photo.jpg')
+        converter.resize_image('/source/photo.jpg', 'photo.jpg')
 
-            mock_transpose.assert_called_once_with(test_img)
+        mock_transpose.assert_called_once_with(test_img, in_place=True)
 
     @patch('PIL.ImageOps.exif_transpose')
     @patch('PIL.Image.open')
-    def test_exif_portrait_correction(self, mock_open, mock_transpose):
+    def test_exif_portrait_correction(self, mock_open, mock_transpose, fused_enhance, fake_image_factory, converter):
         """Test that portrait EXIF rotation (6) is handled."""
-        from image_converter import ImageConverter
+        test_img = mock_open.return_value = fake_image_factory(480, 800, orientation=6)  # Portrait
 
-        test_img = Image.new('RGB', (480, 800), color='blue')  # Portrait
-        mock_open.return_value = test_img
-        mock_transpose.return_value = test_img  # Simulates correction
+        converter.resize_image('/source/portrait.jpg', 'portrait.jpg')
 
-        with patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(test_img, 'save'):
+        mock_transpose.assert_called_once_with(test_img, in_place=True)
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/portrait.jpg', 'portrait.jpg')
+    @pytest.mark.parametrize('orientation', [None, 1], ids=['no_tag', 'identity'])
+    @patch('PIL.ImageOps.exif_transpose')
+    @patch('PIL.Image.open')
+    def test_exif_transpose_skipped_for_identity_orientation(
+        self, mock_open, mock_transpose, fused_enhance, orientation, fake_image_factory, converter
+    ):
+        """Test that images without rotation (no tag or orientation 1) skip EXIF transpose."""
+        mock_open.return_value = fake_image_factory(800, 480, orientation=orientation)
+
+        converter.resize_image('/source/photo.jpg', 'photo.jpg')
 
-            mock_transpose.assert_called()
+        mock_transpose.assert_not_called()
+        fused_enhance.return_value.save.assert_called_once()
+        assert fused_enhance.return_value.save.call_args.args == ('/output/photo.jpg',)
 
     @patch('PIL.ImageOps.exif_transpose')
     @patch('PIL.Image.open')
-    def test_image_without_exif_handled_gracefully(self, mock_open, mock_transpose):
+    def test_image_without_exif_handled_gracefully(
+        self, mock_open, mock_transpose, fused_enhance, rgb_800x480, converter
+    ):
         """Test that image without EXIF data is handled gracefully."""
-        from image_converter import ImageConverter
-
-        test_img = Image.new('RGB', (800, 480), color='white')
+        test_img = rgb_800x480
         mock_open.return_value = test_img
         # ImageOps.exif_transpose returns the image unchanged if no EXIF
         mock_transpose.return_value = test_img
 
-        with patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(test_img, 'save'):
+        with patch.object(test_img, 'save'):
 
-            converter = ImageConverter('/source', '/output')
             converter.resize_image('/source/no_exif.jpg', 'no_exif.jpg')
 
             # Should not raise exception
@@ -410,306 +461,235 @@ class TestColorModeHandling:
     """Tests for handling various color modes."""
 
     @patch('PIL.Image.open')
-    def test_rgb_color_image_processed(self, mock_open):
-        """Test that RGB color image is processed correctly."""
-        from image_converter import ImageConverter
-
-        rgb_img = Image.new('RGB', (800, 480), color='white')
+    def test_rgb_color_image_processed(self, mock_open, fused_enhance, rgb_800x480, converter):
+        """Test that RGB color image is processed without a mode conversion."""
+        rgb_img = rgb_800x480
         mock_open.return_value = rgb_img
 
-        with patch('PIL.ImageOps.exif_transpose', return_value=rgb_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(rgb_img, 'save'):
-
-            converter = ImageConverter('/source', '/output')
+        with patch.object(rgb_img, 'convert', wraps=rgb_img.convert) as mock_convert:
             converter.resize_image('/source/rgb.jpg', 'rgb.jpg')
 
-            assert True
+        mock_convert.assert_not_called()
+        assert fused_enhance.call_args.args[0].mode == 'RGB'
 
+    @pytest.mark.parametrize('mode,color', [
+        ('RGBA', (255, 255, 255, 128)),
+        ('P', 0),
+        ('LA', (128, 255)),
+        ('CMYK', (0, 0, 0, 0)),
+    ], ids=['rgba', 'palette', 'gray_alpha', 'cmyk'])
     @patch('PIL.Image.open')
-    def test_rgba_image_with_transparency(self, mock_open):
-        """Test that RGBA image with transparency is processed."""
-        from image_converter import ImageConverter
-
-        rgba_img = Image.new('RGBA', (800, 480), color=(255, 255, 255, 255))
-        mock_open.return_value = rgba_img
+    def test_other_modes_converted_to_rgb(self, mock_open, fused_enhance, mode, color, converter):
+        """Test that palette, alpha and CMYK images are converted to RGB before resizing."""
+        src_img = Image.new(mode, (800, 480), color=color)
+        mock_open.return_value = src_img
 
-        with patch('PIL.ImageOps.exif_transpose', return_value=rgba_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(rgba_img, 'save'):
+        with patch.object(src_img, 'convert', wraps=src_img.convert) as mock_convert:
+            converter.resize_image('/source/image.png', 'image.png')
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/rgba.png', 'rgba.png')
-
-            assert True
+        mock_convert.assert_called_once_with('RGB')
+        assert fused_enhance.call_args.args[0].mode == 'RGB'
+        fused_enhance.return_value.save.assert_called_once()
+        assert fused_enhance.return_value.save.call_args.args == ('/output/image.png',)
 
     @patch('PIL.Image.open')
-    def test_grayscale_image_processed(self, mock_open):
-        """Test that grayscale (L mode) image is processed."""
-        from image_converter import ImageConverter
-
+    def test_grayscale_image_processed(self, mock_open, converter):
+        """Test that grayscale (L mode) image is processed without a mode conversion."""
         gray_img = Image.new('L', (800, 480), color=128)
         mock_open.return_value = gray_img
 
-        with patch('PIL.ImageOps.exif_transpose', return_value=gray_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(gray_img, 'save'):
-
-            converter = ImageConverter('/source', '/output')
+        with patch.object(gray_img, 'convert') as mock_convert, patch.object(Image.Image, 'save') as mock_save:
             converter.resize_image('/source/gray.jpg', 'gray.jpg')
 
-            assert True
-
-    @patch('PIL.Image.open')
-    def test_palette_mode_image_processed(self, mock_open):
-        """Test that palette mode (P mode) image is processed."""
-        from image_converter import ImageConverter
-
-        palette_img = Image.new('P', (800, 480))
-        mock_open.return_value = palette_img
-
-        with patch('PIL.ImageOps.exif_transpose', return_value=palette_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(palette_img, 'save'):
-
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/palette.gif', 'palette.gif')
-
-            assert True
+        mock_convert.assert_not_called()
+        mock_save.assert_called_once()
+        assert mock_save.call_args.args == ('/output/gray.jpg',)
 
 
 class TestEnhancementOperations:
-    """Tests for image enhancement (color and contrast)."""
-
-    @patch('PIL.Image.open')
-    @patch('PIL.ImageEnhance.Color')
-    def test_color_enhancement_applied(self, mock_color_class, mock_open):
-        """Test that color enhancement with factor 1.5 is applied."""
-        from image_converter import ImageConverter
-
-        test_img = Image.new('RGB', (800, 480), color='white')
-        mock_open.return_value = test_img
+    """Tests for image enhancement (color and contrast).
 
-        mock_color_enhancer = MagicMock()
-        mock_color_class.return_value = mock_color_enhancer
-        mock_color_enhancer.enhance.return_value = test_img
-
-        with patch('PIL.ImageOps.exif_transpose', return_value=test_img), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(test_img, 'save'):
-
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/test.jpg', 'test.jpg')
-
-            mock_color_class.assert_called_once()
-            mock_color_enhancer.enhance.assert_called_once_with(1.5)
+    RGB images use the fused single-pass enhancement and grayscale images a
+    contrast lookup table; other modes are converted to RGB beforehand.
+    """
 
     @patch('PIL.Image.open')
+    @patch('PIL.ImageEnhance.Color')
     @patch('PIL.ImageEnhance.Contrast')
-    def test_contrast_enhancement_applied(self, mock_contrast_class, mock_open):
-        """Test that contrast enhancement with factor 1.5 is applied."""
-        from image_converter import ImageConverter
-
-        test_img = Image.new('RGB', (800, 480), color='white')
-        mock_open.return_value = test_img
-
-        mock_contrast_enhancer = MagicMock()
-        mock_contrast_class.return_value = mock_contrast_enhancer
-        mock_contrast_enhancer.enhance.return_value = test_img
-
-        with patch('PIL.ImageOps.exif_transpose', return_value=test_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch.object(test_img, 'save'):
+    def test_rgb_image_uses_fused_enhancement(
+        self, mock_contrast_class, mock_color_class, mock_open, fused_enhance, rgb_800x480, converter
+    ):
+        """Test that RGB images get both 1.5 factors from one fused pass."""
+        mock_open.return_value = rgb_800x480
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/test.jpg', 'test.jpg')
+        converter.resize_image('/source/test.jpg', 'test.jpg')
 
-            mock_contrast_class.assert_called_once()
-            mock_contrast_enhancer.enhance.assert_called_once_with(1.5)
+        assert fused_enhance.call_args.args[1:] == (1.5, 1.5)
+        mock_color_class.assert_not_called()
+        mock_contrast_class.assert_not_called()
+
+    def test_fused_enhance_matches_sequential_enhancers(self):
+        """Test that the fused pass reproduces Color(1.5) then Contrast(1.5) within rounding."""
+        # Saturated and mid-tone colors, including values the color step clips
+        pixels = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (200, 120, 40), (10, 10, 10), (128, 128, 128)]
+        src = Image.new('RGB', (len(pixels), 1))
+        src.putdata(pixels)
+
+        expected = ImageEnhance.Contrast(ImageEnhance.Color(src).enhance(1.5)).enhance(1.5)
+        fused = _fused_enhance(src, 1.5, 1.5)
+
+        for x in range(len(pixels)):
+            got, want = fused.getpixel((x, 0)), expected.getpixel((x, 0))
+            assert all(abs(g - w) <= 2 for g, w in zip(got, want))
+
+    @pytest.mark.parametrize(
+        'pixel', [(128, 0, 128), (255, 0, 0), (0, 255, 255), (250, 250, 5)], ids=['purple', 'red', 'cyan', 'yellow']
+    )
+    def test_fused_enhance_matches_on_saturated_solid_color(self, pixel):
+        """Test that the contrast mean is taken after the color step clips saturated pixels."""
+        src = Image.new('RGB', (4, 4), pixel)
+
+        expected = ImageEnhance.Contrast(ImageEnhance.Color(src).enhance(1.5)).enhance(1.5)
+        got, want = _fused_enhance(src, 1.5, 1.5).getpixel((0, 0)), expected.getpixel((0, 0))
+
+        assert all(abs(g - w) <= 2 for g, w in zip(got, want))
+
+    @pytest.mark.parametrize(
+        'level',
+        [
+            lambda rng: rng.randrange(256),
+            lambda rng: rng.choice((0, 255, rng.randrange(256))),
+            lambda rng: rng.choice((rng.randrange(16), rng.randrange(240, 256))),
+        ],
+        ids=['full_range', 'saturated', 'clipping'],
+    )
+    def test_enhance_kernel_matches_pil_within_tolerance(self, level):
+        """Test the fused pass against the sequential enhancers on a fixed 32x32 noise patch.
+
+        The only deviation is the color matrix using exact luma where ImageEnhance.Color
+        rounds it first: at most 1 level, which Contrast(1.5) can stretch to 2.
+        """
+        rng = random.Random(1234)
+        src = Image.new('RGB', (32, 32))
+        src.putdata([(level(rng), level(rng), level(rng)) for _ in range(32 * 32)])
+
+        expected = ImageEnhance.Contrast(ImageEnhance.Color(src).enhance(1.5)).enhance(1.5)
+        diff = ImageChops.difference(_fused_enhance(src, 1.5, 1.5), expected)
+
+        assert max(high for _, high in diff.getextrema()) <= 2
 
     @patch('PIL.Image.open')
     @patch('PIL.ImageEnhance.Color')
     @patch('PIL.ImageEnhance.Contrast')
-    def test_both_enhancements_applied_in_sequence(
-        self, mock_contrast_class, mock_color_class, mock_open
+    def test_resize_image_uses_point_lut_when_available(
+        self, mock_contrast_class, mock_color_class, mock_open, converter
     ):
-        """Test that both color and contrast enhancements are applied."""
-        from image_converter import ImageConverter
-
-        test_img = Image.new('RGB', (800, 480), color='white')
+        """Test that grayscale images are enhanced through Image.point() instead of ImageEnhance."""
+        test_img = Image.new('L', (800, 480), color=128)
         mock_open.return_value = test_img
 
-        mock_color_enhancer = MagicMock()
-        mock_color_class.return_value = mock_color_enhancer
-        mock_color_enhancer.enhance.return_value = test_img
+        with patch.object(Image.Image, 'point') as mock_point:
+            converter.resize_image('/source/test.jpg', 'test.jpg')
 
-        mock_contrast_enhancer = MagicMock()
-        mock_contrast_class.return_value = mock_contrast_enhancer
-        mock_contrast_enhancer.enhance.return_value = test_img
+        assert len(mock_point.call_args.args[0]) == 256
+        mock_point.return_value.save.assert_called_once()
+        assert mock_point.return_value.save.call_args.args == ('/output/test.jpg',)
+        mock_color_class.assert_not_called()
+        mock_contrast_class.assert_not_called()
 
-        with patch('PIL.ImageOps.exif_transpose', return_value=test_img), \
-             patch.object(test_img, 'save'):
+    def test_contrast_lut_matches_contrast_enhancer(self):
+        """Test that the lookup table reproduces ImageEnhance.Contrast(1.5) exactly."""
+        src = Image.new('L', (256, 1))
+        src.putdata(list(range(256)))
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/test.jpg', 'test.jpg')
+        expected = ImageEnhance.Contrast(src).enhance(1.5)
+        result = _contrast_lut(src, 1.5)
 
-            # Both should be called
-            assert mock_color_class.called
-            assert mock_contrast_class.called
+        assert [result.getpixel((x, 0)) for x in range(256)] == [expected.getpixel((x, 0)) for x in range(256)]
 
 
 class TestErrorHandling:
     """Tests for error handling in image processing."""
 
     @patch('PIL.Image.open')
-    def test_corrupted_image_file_raises_exception(self, mock_open):
+    def test_corrupted_image_file_raises_exception(self, mock_open, converter):
         """Test that corrupted image file raises appropriate exception."""
-        from image_converter import ImageConverter
-
         mock_open.side_effect = IOError("Cannot identify image file")
 
-        converter = ImageConverter('/source', '/output')
-
         with pytest.raises(IOError):
             converter.resize_image('/source/corrupted.jpg', 'corrupted.jpg')
 
     @patch('PIL.Image.open')
-    def test_missing_image_file_raises_exception(self, mock_open):
+    def test_missing_image_file_raises_exception(self, mock_open, converter):
         """Test that missing image file raises FileNotFoundError."""
-        from image_converter import ImageConverter
-
         mock_open.side_effect = FileNotFoundError("No such file or directory")
 
-        converter = ImageConverter('/source', '/output')
-
         with pytest.raises(FileNotFoundError):
             converter.resize_image('/source/missing.jpg', 'missing.jpg')
 
     @patch('PIL.Image.open')
-    def test_invalid_image_format_raises_exception(self, mock_open):
+    def test_invalid_image_format_raises_exception(self, mock_open, converter):
         """Test that invalid image format raises exception."""
-        from image_converter import ImageConverter
-
         mock_open.side_effect = ValueError("Unsupported image format")
 
-        converter = ImageConverter('/source', '/output')
-
         with pytest.raises(ValueError):
             converter.resize_image('/source/invalid.jpg', 'invalid.jpg')
 
     @patch('PIL.Image.open')
-    @patch('PIL.ImageOps.exif_transpose')
-    @patch('PIL.ImageEnhance.Color')
-    @patch('PIL.ImageEnhance.Contrast')
-    def test_permission_denied_on_output_raises_exception(self, mock_contrast_cls, mock_color_cls, mock_exif, mock_open):
+    def test_permission_denied_on_output_raises_exception(self, mock_open, fused_enhance, rgb_800x480, converter):
         """Test that permission denied on output directory raises exception."""
-        from image_converter import ImageConverter
-
-        test_img = Image.new('RGB', (800, 480), color='white')
-        mock_open.return_value = test_img
-        mock_exif.return_value = test_img
-
-        # Mock enhancements
-        mock_color_img = MagicMock(spec=Image.Image)
-        mock_color_enhancer = MagicMock()
-        mock_color_enhancer.enhance.return_value = mock_color_img
-        mock_color_cls.return_value = mock_color_enhancer
+        mock_open.return_value = rgb_800x480
 
         # Make the final image's save() raise PermissionError
-        mock_final_img = MagicMock(spec=Image.Image)
-        mock_final_img.save.side_effect = PermissionError("Permission denied")
-        mock_contrast_enhancer = MagicMock()
-        mock_contrast_enhancer.enhance.return_value = mock_final_img
-        mock_contrast_cls.return_value = mock_contrast_enhancer
-
-        converter = ImageConverter('/source', '/output')
+        fused_enhance.return_value.save.side_effect = PermissionError("Permission denied")
 
         with pytest.raises(PermissionError):
             converter.resize_image('/source/test.jpg', 'test.jpg')
 
     @patch('PIL.Image.open')
-    @patch('PIL.ImageOps.exif_transpose')
-    @patch('PIL.ImageEnhance.Color')
-    @patch('PIL.ImageEnhance.Contrast')
-    def test_insufficient_disk_space_raises_exception(self, mock_contrast_cls, mock_color_cls, mock_exif, mock_open):
+    def test_insufficient_disk_space_raises_exception(self, mock_open, fused_enhance, rgb_800x480, converter):
         """Test that insufficient disk space raises exception."""
-        from image_converter import ImageConverter
-
-        test_img = Image.new('RGB', (800, 480), color='white')
-        mock_open.return_value = test_img
-        mock_exif.return_value = test_img
-
-        # Mock enhancements
-        mock_color_img = MagicMock(spec=Image.Image)
-        mock_color_enhancer = MagicMock()
-        mock_color_enhancer.enhance.return_value = mock_color_img
-        mock_color_cls.return_value = mock_color_enhancer
+        mock_open.return_value = rgb_800x480
 
         # Make the final image's save() raise OSError
-        mock_final_img = MagicMock(spec=Image.Image)
-        mock_final_img.save.side_effect = OSError("No space left on device")
-        mock_contrast_enhancer = MagicMock()
-        mock_contrast_enhancer.enhance.return_value = mock_final_img
-        mock_contrast_cls.return_value = mock_contrast_enhancer
-
-        converter = ImageConverter('/source', '/output')
+        fused_enhance.return_value.save.side_effect = OSError("No space left on device")
 
         with pytest.raises(OSError):
             converter.resize_image('/source/test.jpg', 'test.jpg')
 
-
 class TestFileHandling:
     """Tests for file handling edge cases."""
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_non_ascii_filename_preserved(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_non_ascii_filename_preserved(self, mock_scandir, converter):
         """Test that non-ASCII filename (unicode characters) are handled."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = ['фото.jpg', '照片.png', 'φωτογραφία.bmp']
-        mock_isfile.return_value = True
+        mock_scandir.return_value = _dir_entries(['фото.jpg', '照片.png', 'φωτογραφία.bmp'])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 3
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_filename_with_spaces_preserved(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_filename_with_spaces_preserved(self, mock_scandir, converter):
         """Test that filename with spaces are preserved."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = [
+        mock_scandir.return_value = _dir_entries([
             'my photo.jpg', 'nice image 2024.png', 'best pic ever.bmp'
-        ]
-        mock_isfile.return_value = True
+        ])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 3
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_filename_with_special_characters_preserved(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_filename_with_special_characters_preserved(self, mock_scandir, converter):
         """Test that filename with special characters are preserved."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = [
+        mock_scandir.return_value = _dir_entries([
             'photo-2024.jpg', 'image_backup.png', 'pic#1.bmp'
-        ]
-        mock_isfile.return_value = True
+        ])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 3
@@ -718,33 +698,23 @@ class TestFileHandling:
 class TestBatchProcessing:
     """Tests for batch image processing."""
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_multiple_images_processed_sequentially(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_multiple_images_processed_sequentially(self, mock_scandir, converter):
         """Test that multiple images are processed in sequence."""
-        from image_converter import ImageConverter
-
         files = [f'image{i}.jpg' for i in range(10)]
-        mock_listdir.return_value = files
-        mock_isfile.return_value = True
+        mock_scandir.return_value = _dir_entries(files)
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             assert mock_resize.call_count == 10
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_batch_processing_no_interference_between_images(self, mock_listdir, mock_isfile):
+    @patch('os.scandir')
+    def test_batch_processing_no_interference_between_images(self, mock_scandir, converter):
         """Test that processing each image doesn't affect others."""
-        from image_converter import ImageConverter
-
-        mock_listdir.return_value = ['img1.jpg', 'img2.jpg', 'img3.jpg']
-        mock_isfile.return_value = True
+        mock_scandir.return_value = _dir_entries(['img1.jpg', 'img2.jpg', 'img3.jpg'])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             # Each image should be processed with correct path
@@ -755,78 +725,123 @@ class TestBatchProcessing:
             assert '/source/img3.jpg' in str(calls[2])
 
 
-class TestEdgeCases:
-    """Tests for edge cases and boundary conditions."""
+    @patch('os.cpu_count', return_value=4)
+    @patch('image_converter.ProcessPoolExecutor')
+    @patch('os.scandir')
+    def test_process_images_uses_process_pool(self, mock_scandir, mock_pool, mock_cpu_count, converter):
+        """Test that valid images are dispatched to a process pool in a single map() call."""
+        mock_scandir.return_value = _dir_entries(['img1.jpg', 'notes.txt', 'img2.png'])
 
-    @patch('PIL.Image.open')
-    def test_very_small_image_upscaled(self, mock_open):
-        """Test that very small image (100x100) is upscaled to 800x480."""
-        from image_converter import ImageConverter
+        converter.process_images()
 
-        small_img = Image.new('RGB', (100, 100), color='white')
-        mock_open.return_value = small_img
+        mock_pool.assert_called_once_with(max_workers=2)
+        executor = mock_pool.return_value.__enter__.return_value
+        executor.map.assert_called_once_with(
+            converter.resize_image,
+            ['/source/img1.jpg', '/source/img2.png'],
+            ['img1.jpg', 'img2.png'],
+        )
 
-        with patch('PIL.ImageOps.exif_transpose', return_value=small_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(small_img, 'save'):
+    @pytest.mark.parametrize('cpu_count', [2, 64], ids=['dual_core', 'many_cores'])
+    @patch('image_converter.ProcessPoolExecutor')
+    @patch('os.scandir')
+    def test_process_pool_worker_count_is_capped(self, mock_scandir, mock_pool, cpu_count, converter):
+        """Test that the process pool never exceeds _MAX_WORKERS, however many cores are available."""
+        mock_scandir.return_value = _dir_entries(['img1.jpg'])
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/tiny.jpg', 'tiny.jpg')
+        with patch('os.cpu_count', return_value=cpu_count):
+            converter.process_images()
 
-            assert True
+        mock_pool.assert_called_once_with(max_workers=image_converter._MAX_WORKERS)
 
-    @patch('PIL.Image.open')
-    def test_very_large_image_downscaled(self, mock_open):
-        """Test that very large image (4000x3000) is downscaled efficiently."""
-        from image_converter import ImageConverter
+    @patch('image_converter.ProcessPoolExecutor')
+    @patch('os.scandir')
+    def test_process_pool_not_started_without_images(self, mock_scandir, mock_pool, converter):
+        """Test that no worker processes are started when there is nothing to process."""
+        mock_scandir.return_value = _dir_entries(['readme.txt', '.DS_Store'])
 
-        large_img = Image.new('RGB', (4000, 3000), color='white')
-        mock_open.return_value = large_img
+        converter.process_images()
 
-        with patch('PIL.ImageOps.exif_transpose', return_value=large_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(large_img, 'save'):
+        mock_pool.assert_not_called()
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/huge.jpg', 'huge.jpg')
+    @pytest.mark.parametrize('cpu_count', [1, None], ids=['single_core', 'unknown'])
+    @patch('image_converter.ThreadPoolExecutor')
+    @patch('image_converter.ProcessPoolExecutor')
+    @patch('os.scandir')
+    def test_single_core_uses_thread_pool(self, mock_scandir, mock_pool, mock_threads, cpu_count, converter):
+        """Test that single-core boards overlap I/O with two threads instead of a process pool."""
+        mock_scandir.return_value = _dir_entries(['img1.jpg'])
 
-            assert True
+        with patch('os.cpu_count', return_value=cpu_count):
+            converter.process_images()
+
+        mock_pool.assert_not_called()
+        mock_threads.assert_called_once_with(max_workers=2)
+        mock_threads.return_value.__enter__.return_value.map.assert_called_once()
+
+    @patch('os.cpu_count', return_value=1)
+    @patch('os.scandir')
+    def test_pipeline_overlaps_io_and_cpu(self, mock_scandir, mock_cpu_count, converter):
+        """Test that a real two-thread pool runs resize_image() once for every image."""
+        names = [f'img{i}.jpg' for i in range(4)]
+        mock_scandir.return_value = _dir_entries(names)
+
+        with (
+            patch('image_converter.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_threads,
+            patch.object(converter, 'resize_image') as mock_resize,
+        ):
+            converter.process_images()
+
+        mock_threads.assert_called_once_with(max_workers=2)
+        assert mock_resize.call_count == len(names)
+        mock_resize.assert_has_calls([call(f'/source/{name}', name) for name in names], any_order=True)
+
+
+class TestEdgeCases:
+    """Tests for edge cases and boundary conditions."""
 
     @patch('PIL.Image.open')
-    def test_image_exactly_target_size(self, mock_open):
-        """Test that image exactly target size (800x480) is unchanged."""
-        from image_converter import ImageConverter
+    def test_very_small_image_upscaled(self, mock_open, fused_enhance, fake_image_factory, converter):
+        """Test that very small image (100x100) is upscaled to 800x480."""
+        small_img = mock_open.return_value = fake_image_factory(100, 100)
 
-        exact_img = Image.new('RGB', (800, 480), color='white')
-        mock_open.return_value = exact_img
+        converter.resize_image('/source/tiny.jpg', 'tiny.jpg')
 
-        with patch('PIL.ImageOps.exif_transpose', return_value=exact_img), \
-             patch('PIL.ImageEnhance.Color'), \
-             patch('PIL.ImageEnhance.Contrast'), \
-             patch.object(exact_img, 'save'):
+        small_img.resize.assert_called_once_with(
+            (800, 480), Image.Resampling.BILINEAR, box=(0, 20, 100, 80), reducing_gap=2.0
+        )
 
-            converter = ImageConverter('/source', '/output')
-            converter.resize_image('/source/exact.jpg', 'exact.jpg')
+    @patch('PIL.Image.open')
+    def test_very_large_image_downscaled(self, mock_open, fused_enhance, fake_image_factory, converter):
+        """Test that very large image (4000x3000) is downscaled efficiently."""
+        large_img = mock_open.return_value = fake_image_factory(4000, 3000)
 
-            assert True
+        converter.resize_image('/source/huge.jpg', 'huge.jpg')
 
-    @patch('os.path.isfile')
-    @patch('os.listdir')
-    def test_mixed_valid_and_invalid_files(self, mock_listdir, mock_isfile):
-        """Test processing with mix of valid and invalid files."""
-        from image_converter import ImageConverter
+        large_img.resize.assert_called_once_with(
+            (800, 480), Image.Resampling.LANCZOS, box=(0, 300, 4000, 2700), reducing_gap=3.0
+        )
 
-        mock_listdir.return_value = [
+    @patch('PIL.Image.open')
+    def test_image_exactly_target_size(self, mock_open, fused_enhance, fake_image_factory, converter):
+        """Test that image exactly target size (800x480) is not resized."""
+        exact_img = mock_open.return_value = fake_image_factory(800, 480)
+
+        converter.resize_image('/source/exact.jpg', 'exact.jpg')
+
+        exact_img.resize.assert_not_called()
+        assert fused_enhance.call_args.args[0] is exact_img
+
+    @patch('os.scandir')
+    def test_mixed_valid_and_invalid_files(self, mock_scandir, converter):
+        """Test processing with mix of valid and invalid files."""
+        mock_scandir.return_value = _dir_entries([
             'image1.jpg', 'readme.txt', 'image2.png',
             'config.ini', 'image3.bmp', '.DS_Store',
             'script.py', 'image4.gif'
-        ]
-        mock_isfile.return_value = True
+        ])
 
-        with patch.object(ImageConverter, 'resize_image') as mock_resize:
-            converter = ImageConverter('/source', '/output')
+        with patch.object(converter, 'resize_image') as mock_resize:
             converter.process_images()
 
             # Should only process 4 valid image files